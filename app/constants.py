@@ -31,3 +31,32 @@ class NotificationsData:
     DRAW_IS_COMPLETED = (
         "Жеребьевка завершена!\nЗагляни в личный кабинет и узнай своего получателя."
     )
+
+
+class Pagination:
+    PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+
+
+class SecretKeyGeneration:
+    MAX_ATTEMPTS = 5
+
+
+class SecretKeyCache:
+    MAX_SIZE = 10000
+    TTL = 300
+    NEGATIVE_TTL = 10
+
+
+class StaticAssets:
+    DIRECTORY = "static"
+    BUILD_DIRECTORY = "dist"
+    MANIFEST = "manifest.json"
+    ENTRY_POINTS = ["style.css"]
+    FINGERPRINT_LENGTH = 12
+    IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+    REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class Streaming:
+    CHUNK_SIZE = 16 * 1024
@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, List, Optional
+
+MISSING = object()
+
+_caches: List["LRUCache"] = []
+
+
+def get_caches() -> List["LRUCache"]:
+    """All caches created in this process"""
+    return list(_caches)
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache with optional TTL and hit statistics
+
+    Besides the number of entries (`maxsize`, None - unbounded) the cache can
+    be bounded by total size: `weigh` returns the size of a value,
+    `max_bytes` is the limit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: Optional[int] = 1024,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        weigh: Callable[[Any], int] = len,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._weigh = weigh if max_bytes is not None else lambda value: 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        _caches.append(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns cached value or default if it is missing or expired"""
+        with self._lock:
+            item = self._data.get(key, MISSING)
+            if item is not MISSING:
+                value, expires_at, _ = item
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._pop(key)
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Stores value, evicting the least recently used entries if full"""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        size = self._weigh(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._data[key] = (value, expires_at, size)
+            self.bytes += size
+            while (self.maxsize is not None and len(self._data) > self.maxsize) or (
+                self.max_bytes is not None and self.bytes > self.max_bytes
+            ):
+                self._pop(next(iter(self._data)))
+
+    def _pop(self, key: Hashable) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.bytes -= item[2]
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "bytes": self.bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / requests if requests else 0.0,
+            }
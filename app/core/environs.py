@@ -6,3 +6,17 @@ env.read_env()
 
 DATABASE_URL = env("DATABASE_URL")
 SECRET_KEY = env("SECRET_KEY")
+
+DATABASE_REPLICA_URLS = env.list("DATABASE_REPLICA_URLS", [])
+REPLICA_STICKY_SECONDS = env.float("REPLICA_STICKY_SECONDS", 5.0)
+
+DEBUG = env.bool("DEBUG", False)
+ADMIN_EMAILS = env.list("ADMIN_EMAILS", [])
+
+SLOW_QUERY_LOG = env.bool("SLOW_QUERY_LOG", False)
+SLOW_QUERY_THRESHOLD_MS = env.float("SLOW_QUERY_THRESHOLD_MS", 200.0)
+
+FRAGMENT_CACHE_MAX_BYTES = env.int("FRAGMENT_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+COMPRESSION_MINIMUM_SIZE = env.int("COMPRESSION_MINIMUM_SIZE", 1000)
+COMPRESSION_LEVEL = env.int("COMPRESSION_LEVEL", 6)
@@ -0,0 +1,52 @@
+from threading import Lock
+from typing import Dict, Hashable, Optional
+
+from app.core.cache import LRUCache
+from app.core.environs import FRAGMENT_CACHE_MAX_BYTES
+
+
+class FragmentCache:
+    """
+    Rendered HTML fragments keyed by name, game id and version stamps
+
+    Version stamps (participants_version, updated_at, ...) come from the game
+    row, so every process notices changes made by the others. On top of that
+    a local generation per game lets the service layer invalidate fragments
+    of a game right after commit; old entries are never read again and get
+    evicted by the byte-bounded LRU.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._cache = LRUCache(
+            "fragments",
+            maxsize=None,
+            max_bytes=max_bytes,
+            weigh=lambda html: len(html.encode()),
+        )
+        self._generations: Dict[int, int] = {}
+        self._lock = Lock()
+
+    def key(self, name: str, game_id: int, *stamps: Hashable) -> tuple:
+        return (name, game_id, self._generations.get(game_id, 0), *stamps)
+
+    def get(self, key: tuple) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: tuple, html: str) -> None:
+        self._cache.set(key, html)
+
+    def invalidate_game(self, game_id: int) -> None:
+        """Makes all cached fragments of the game stale"""
+        with self._lock:
+            self._generations[game_id] = self._generations.get(game_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generations.clear()
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+fragment_cache = FragmentCache(FRAGMENT_CACHE_MAX_BYTES)
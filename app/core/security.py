@@ -2,9 +2,9 @@ import secrets
 from string import ascii_lowercase, ascii_uppercase, digits
 
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
 
-from app.db.models import Game
+SECRET_KEY_ALPHABET = ascii_lowercase + ascii_uppercase + digits
+SECRET_KEY_LENGTH = 10
 
 pwd_context = CryptContext(
     schemes=["pbkdf2_sha256"], deprecated="auto", pbkdf2_sha256__default_rounds=300000
@@ -26,13 +26,12 @@ def verify_password(expected_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(expected_password, hashed_password)
 
 
-def generate_secret_key_for_game(db: Session) -> str:
-    """Generate unique secret key for game"""
-    while True:
-        characters = ascii_lowercase + ascii_uppercase + digits
-        key = "".join(secrets.choice(characters) for _ in range(10))
-        existing_key = (
-            db.query(Game).filter_by(secret_key=key, is_deleted=False).first()
-        )
-        if not existing_key:
-            return key
+def generate_secret_key() -> str:
+    """
+    Generate random secret key for game. Uniqueness is guaranteed by the
+    unique constraint on insert (see GameService.create_game), with 62^10
+    possible keys collisions are practically never retried
+    """
+    return "".join(
+        secrets.choice(SECRET_KEY_ALPHABET) for _ in range(SECRET_KEY_LENGTH)
+    )
@@ -1,7 +1,24 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import Query, declarative_base, sessionmaker
+import random
+import time
+from collections import Counter
+from functools import wraps
+from threading import Lock
+from typing import Callable, Dict, Optional
 
-from app.core.environs import DATABASE_URL
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import (
+    Query,
+    Session,
+    declarative_base,
+    sessionmaker,
+    with_loader_criteria,
+)
+
+from app.core.environs import (
+    DATABASE_REPLICA_URLS,
+    DATABASE_URL,
+    REPLICA_STICKY_SECONDS,
+)
 
 
 class SoftDeleteQuery(Query):
@@ -9,6 +26,10 @@ class SoftDeleteQuery(Query):
         """Filter out soft-deleted records"""
         return self.filter_by(is_deleted=False)
 
+    def with_deleted(self):
+        """Disable automatic soft-delete filtering for this query"""
+        return self.execution_options(include_deleted=True)
+
     def get(self, ident):
         """Get record by ID, excluding soft-deleted ones."""
         obj = super().get(ident)
@@ -21,8 +42,169 @@ class SoftDeleteQuery(Query):
         return self.not_deleted().first()
 
 
+class SoftDeleteSession(Session):
+    """
+    Session that hides soft-deleted rows from every ORM SELECT
+
+    The criterion is applied to plain queries, relationship lazy loads and
+    eager loads. Admin tooling can opt out per query with
+    ``query.with_deleted()`` / ``execution_options(include_deleted=True)``
+    or for a whole session with ``SessionLocal(info={"include_deleted": True})``.
+    """
+
+
+@event.listens_for(SoftDeleteSession, "do_orm_execute")
+def _add_soft_delete_criteria(execute_state):
+    """Adds 'is_deleted = false' criteria for all soft-deletable entities"""
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.execution_options.get("include_deleted", False)
+        or execute_state.session.info.get("include_deleted", False)
+    ):
+        return
+
+    from app.db.models import SoftDeleteMixin
+
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(
+            SoftDeleteMixin,
+            lambda cls: cls.is_deleted == False,
+            include_aliases=True,
+        )
+    )
+
+
+_stats_lock = Lock()
+_engine_usage: Counter = Counter()
+_recent_writes: Dict[str, float] = {}
+
+
+def mark_recent_write(sticky_key: Optional[str]) -> None:
+    """Remembers that the client has just written to the primary"""
+    if not sticky_key:
+        return
+    now = time.monotonic()
+    with _stats_lock:
+        _recent_writes[sticky_key] = now
+        if len(_recent_writes) > 1000:
+            for key, written_at in list(_recent_writes.items()):
+                if now - written_at > REPLICA_STICKY_SECONDS:
+                    del _recent_writes[key]
+
+
+def has_recent_write(sticky_key: Optional[str]) -> bool:
+    """Checks whether the client wrote recently and must read from the primary"""
+    if not sticky_key:
+        return False
+    written_at = _recent_writes.get(sticky_key)
+    return written_at is not None and (
+        time.monotonic() - written_at < REPLICA_STICKY_SECONDS
+    )
+
+
+def get_engine_stats() -> Dict[str, int]:
+    """Returns how many statements were routed to every engine"""
+    with _stats_lock:
+        return dict(_engine_usage)
+
+
+class RoutingSession(SoftDeleteSession):
+    """
+    Session that sends reads of read-only service methods to a replica
+
+    Replica engines are passed through ``info={"replicas": [...]}``. Flushes,
+    non-SELECT statements and everything after the session's own write go to
+    the primary, as do all reads of a client (``info["sticky_key"]``) for
+    REPLICA_STICKY_SECONDS after it committed a write.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        replicas = self.info.get("replicas")
+        if replicas and self._can_use_replica(clause):
+            if "replica_index" not in self.info:
+                self.info["replica_index"] = random.randrange(len(replicas))
+            index = self.info["replica_index"]
+            self._record_usage(f"replica{index}")
+            return replicas[index]
+
+        self._record_usage("primary")
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+    def _can_use_replica(self, clause) -> bool:
+        return (
+            self.info.get("read_only_depth", 0) > 0
+            and not self._flushing
+            and not self.info.get("has_writes", False)
+            and getattr(clause, "is_select", False)
+            and not has_recent_write(self.info.get("sticky_key"))
+        )
+
+    @staticmethod
+    def _record_usage(engine_name: str) -> None:
+        with _stats_lock:
+            _engine_usage[engine_name] += 1
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _remember_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _mark_sticky_client(session):
+    if session.info.pop("has_writes", False):
+        mark_recent_write(session.info.get("sticky_key"))
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_writes(session):
+    session.info.pop("has_writes", None)
+
+
+def on_commit(db: Session, callback: Callable[[], None]) -> None:
+    """Runs the callback once the current transaction is committed"""
+    db.info.setdefault("on_commit", []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit_callbacks(session):
+    for callback in session.info.pop("on_commit", []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_on_commit_callbacks(session):
+    session.info.pop("on_commit", None)
+
+
+def read_only(func):
+    """Routes queries of a read-only service method to a replica if possible"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        db = kwargs.get("db", args[0] if args else None)
+        if not isinstance(db, Session):
+            return func(*args, **kwargs)
+
+        db.info["read_only_depth"] = db.info.get("read_only_depth", 0) + 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            db.info["read_only_depth"] -= 1
+
+    return wrapper
+
+
 engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine, query_cls=SoftDeleteQuery)
+replica_engines = [create_engine(url) for url in DATABASE_REPLICA_URLS]
+SessionLocal = sessionmaker(
+    bind=engine,
+    class_=RoutingSession,
+    query_cls=SoftDeleteQuery,
+    expire_on_commit=False,
+    info={"replicas": replica_engines},
+)
 Base = declarative_base()
 
 
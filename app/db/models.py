@@ -6,10 +6,12 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import backref, relationship
 
@@ -17,10 +19,21 @@ from app.constants import GameStatus, GiftStatus, JoinRequestStatus
 from app.db.database import Base
 
 
+NOT_DELETED = text("is_deleted = false")
+PENDING_REQUEST = text(f"status = '{JoinRequestStatus.PENDING}' AND is_deleted = false")
+
+
 def now():
     return datetime.now(timezone.utc)
 
 
+def alive_index(name: str, *columns: str, where=NOT_DELETED, unique=False) -> Index:
+    """Partial index covering only rows that are not soft-deleted"""
+    return Index(
+        name, *columns, unique=unique, postgresql_where=where, sqlite_where=where
+    )
+
+
 class SoftDeleteMixin:
     is_deleted = Column(Boolean, default=False, nullable=False)
     deleted_at = Column(DateTime)
@@ -34,7 +47,7 @@ class SoftDeleteMixin:
         self.deleted_at = now()
 
         for rel in self.__mapper__.relationships:
-            if rel.viewonly:
+            if rel.viewonly or not rel.cascade.delete:
                 continue
 
             if rel.mapper.class_ == User:
@@ -88,6 +101,10 @@ class Game(Base, SoftDeleteMixin):
     """Secret Santa game session"""
 
     __tablename__ = "games"
+    __table_args__ = (
+        alive_index("ix_games_organizer_alive", "organizer_id"),
+        Index("ix_games_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
     title = Column(String(200), nullable=False)
@@ -104,6 +121,31 @@ class Game(Base, SoftDeleteMixin):
     created_at = Column(DateTime, default=now)
     updated_at = Column(DateTime, onupdate=now)
 
+    participants_count = Column(Integer, default=0, server_default="0", nullable=False)
+    gifts_planned_count = Column(Integer, default=0, server_default="0", nullable=False)
+    gifts_not_sent_count = Column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    gifts_sent_count = Column(Integer, default=0, server_default="0", nullable=False)
+    gifts_received_count = Column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    requests_pending_count = Column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    requests_approved_count = Column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    requests_rejected_count = Column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+
+    participants_version = Column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    draws_version = Column(Integer, default=0, server_default="0", nullable=False)
+    gifts_version = Column(Integer, default=0, server_default="0", nullable=False)
+
     organizer = relationship("User", back_populates="games_created")
     participants = relationship(
         "Participant",
@@ -125,6 +167,23 @@ class JoinRequest(Base, SoftDeleteMixin):
     """User request to join a game"""
 
     __tablename__ = "join_requests"
+    __table_args__ = (
+        alive_index("ix_join_requests_user_alive", "user_id", "created_at", "id"),
+        alive_index(
+            "ix_join_requests_organizer_status_alive",
+            "organizer_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+        alive_index(
+            "uq_join_requests_pending",
+            "user_id",
+            "game_id",
+            where=PENDING_REQUEST,
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(
@@ -151,6 +210,8 @@ class Participant(Base, SoftDeleteMixin):
     __tablename__ = "participants"
     __table_args__ = (
         UniqueConstraint("user_id", "game_id", name="uq_participant_user_game"),
+        alive_index("ix_participants_game_alive", "game_id"),
+        alive_index("ix_participants_user_alive", "user_id", "game_id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -233,6 +294,10 @@ class Gift(Base, SoftDeleteMixin):
     """Gift within a game"""
 
     __tablename__ = "gifts"
+    __table_args__ = (
+        alive_index("ix_gifts_participant_alive", "participant_id"),
+        alive_index("ix_gifts_receiver_alive", "receiver_participant_id"),
+    )
 
     id = Column(Integer, primary_key=True)
     participant_id = Column(
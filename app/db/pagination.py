@@ -0,0 +1,62 @@
+import base64
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Builds an opaque cursor pointing right after the given row"""
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Parses a cursor built by encode_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = raw.decode("utf-8").split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except ValueError:
+        raise ValueError("Неверный курсор страницы")
+
+
+def apply_keyset(
+    query: Query,
+    created_at_column,
+    id_column,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Query:
+    """Orders the query newest first on (created_at, id) and applies the cursor"""
+    query = query.order_by(created_at_column.desc(), id_column.desc())
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                created_at_column < created_at,
+                and_(created_at_column == created_at, id_column < row_id),
+            )
+        )
+
+    if limit is not None:
+        query = query.limit(limit)
+
+    return query
+
+
+def split_page(
+    items: list, page_size: int, key: Callable = lambda item: item
+) -> Tuple[List, Optional[str]]:
+    """
+    Cuts a page out of items fetched with limit=page_size + 1 and returns
+    it with the cursor of the next page (None on the last page)
+    """
+    if len(items) <= page_size:
+        return items, None
+
+    items = items[:page_size]
+    last = key(items[-1])
+    return items, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,107 @@
+import heapq
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+SLOWEST_STATEMENTS_LIMIT = 5
+N_PLUS_ONE_THRESHOLD = 5
+
+
+@dataclass
+class QueryStats:
+    """SQL statements executed while tracking was active"""
+
+    count: int = 0
+    total_time: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+
+    def add(self, statement: str, duration: float) -> None:
+        """Registers one executed statement"""
+        self.count += 1
+        self.total_time += duration
+        self.statements[statement] += 1
+
+        if len(self.slowest) < SLOWEST_STATEMENTS_LIMIT:
+            heapq.heappush(self.slowest, (duration, statement))
+        elif duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (duration, statement))
+
+    def slowest_statements(self) -> List[Tuple[float, str]]:
+        """Slowest statements, the slowest one first"""
+        return sorted(self.slowest, reverse=True)
+
+    def repeated_statements(
+        self, threshold: int = N_PLUS_ONE_THRESHOLD
+    ) -> List[Tuple[str, int]]:
+        """Statements executed at least `threshold` times - likely N+1 loads"""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+    def report(self) -> str:
+        """Human-readable summary for logs and failed assertions"""
+        lines = [f"{self.count} queries in {self.total_time * 1000:.1f} ms"]
+        for duration, statement in self.slowest_statements():
+            lines.append(f"  {duration * 1000:.1f} ms: {statement}")
+        for statement, count in self.repeated_statements():
+            lines.append(f"  possible N+1, executed {count} times: {statement}")
+        return "\n".join(lines)
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_stats_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.add(statement, time.perf_counter() - context._query_stats_started_at)
+
+
+def install_query_stats(engine: Engine) -> None:
+    """Hooks the engine so that its statements are counted by track_queries()"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collects statements executed in the current context"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Statistics of the innermost active track_queries() block"""
+    return _current_stats.get()
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    """Fails if the block runs more than `max_queries` SQL statements"""
+    with track_queries() as stats:
+        yield stats
+    assert (
+        stats.count <= max_queries
+    ), f"Query budget of {max_queries} exceeded: {stats.report()}"
@@ -0,0 +1,231 @@
+import hashlib
+import logging
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.environs import SLOW_QUERY_THRESHOLD_MS
+
+logger = logging.getLogger(__name__)
+
+SKIP_OPTION = "skip_slow_query_log"
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_NAMED_PARAMETER = re.compile(r"%\(\w+\)s|:\w+|\$\d+|%s")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_statement(statement: str) -> str:
+    """Replaces literals and parameter lists so similar statements match"""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _NAMED_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    return _PARAMETER_LIST.sub("(...)", normalized)
+
+
+def fingerprint_statement(statement: str) -> Tuple[str, str]:
+    """Returns (fingerprint, normalized statement)"""
+    normalized = normalize_statement(statement)
+    fingerprint = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+    return fingerprint, normalized
+
+
+def parameters_shape(parameters, executemany: bool = False) -> str:
+    """Describes bound parameters by their types, without the values"""
+    if executemany and isinstance(parameters, (list, tuple)) and parameters:
+        return f"{parameters_shape(parameters[0])} x {len(parameters)}"
+    if isinstance(parameters, dict):
+        types = ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items())
+        return "{" + types + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(v).__name__ for v in parameters) + ")"
+    return type(parameters).__name__
+
+
+def find_call_site() -> str:
+    """Finds the service method (or route) that issued the current statement"""
+    frame = sys._getframe(1)
+    fallback = "unknown"
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        code = frame.f_code
+        name = getattr(code, "co_qualname", code.co_name)
+        if module.startswith("app.service."):
+            return f"{module}.{name}"
+        if fallback == "unknown" and module.startswith("app.web."):
+            fallback = f"{module}.{name}"
+        frame = frame.f_back
+    return fallback
+
+
+@dataclass
+class SlowQueryEntry:
+    """Slow executions of one normalized statement"""
+
+    fingerprint: str
+    statement: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    parameters_shape: str = ""
+    call_sites: Counter = field(default_factory=Counter)
+    plan: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement,
+            "count": self.count,
+            "total_ms": round(self.total_time * 1000, 2),
+            "mean_ms": round(self.total_time * 1000 / self.count, 2),
+            "max_ms": round(self.max_time * 1000, 2),
+            "parameters_shape": self.parameters_shape,
+            "call_sites": dict(self.call_sites),
+            "plan": self.plan,
+        }
+
+
+class SlowQueryLog:
+    """
+    Opt-in recorder of statements slower than a threshold
+
+    Entries are aggregated by statement fingerprint. The first slow execution
+    of a SELECT also captures its plan in a background thread:
+    EXPLAIN (ANALYZE, BUFFERS) on PostgreSQL, EXPLAIN QUERY PLAN on SQLite.
+    """
+
+    def __init__(self, threshold_ms: float, max_entries: int = 500) -> None:
+        self.threshold = threshold_ms / 1000
+        self.max_entries = max_entries
+        self._entries: Dict[str, SlowQueryEntry] = {}
+        self._planned = set()
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="slow-query-explain"
+        )
+
+    def install(self, engine: Engine) -> None:
+        """Starts recording slow statements of the engine"""
+        if event.contains(engine, "after_cursor_execute", self._after_execute):
+            return
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+
+    def uninstall(self, engine: Engine) -> None:
+        """Stops recording slow statements of the engine"""
+        if event.contains(engine, "after_cursor_execute", self._after_execute):
+            event.remove(engine, "before_cursor_execute", self._before_execute)
+            event.remove(engine, "after_cursor_execute", self._after_execute)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, many):
+        context._slow_query_started_at = time.perf_counter()
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, many):
+        duration = time.perf_counter() - context._slow_query_started_at
+        if duration < self.threshold or context.execution_options.get(SKIP_OPTION):
+            return
+        self.record(conn.engine, statement, parameters, duration, many)
+
+    def record(
+        self,
+        engine: Engine,
+        statement: str,
+        parameters,
+        duration: float,
+        executemany: bool = False,
+    ) -> None:
+        """Adds a slow execution to the log"""
+        fingerprint, normalized = fingerprint_statement(statement)
+        call_site = find_call_site()
+        shape = parameters_shape(parameters, executemany)
+
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                if len(self._entries) >= self.max_entries:
+                    cheapest = min(self._entries.values(), key=lambda e: e.total_time)
+                    del self._entries[cheapest.fingerprint]
+                entry = SlowQueryEntry(fingerprint=fingerprint, statement=normalized)
+                self._entries[fingerprint] = entry
+            entry.count += 1
+            entry.total_time += duration
+            entry.max_time = max(entry.max_time, duration)
+            entry.parameters_shape = shape
+            entry.call_sites[call_site] += 1
+
+            capture_plan = (
+                fingerprint not in self._planned
+                and not executemany
+                and normalized.lower().startswith("select")
+            )
+            if capture_plan:
+                self._planned.add(fingerprint)
+
+        logger.warning(
+            "Slow query %.1f ms in %s, params %s: %s",
+            duration * 1000,
+            call_site,
+            shape,
+            normalized,
+        )
+        if capture_plan:
+            self._executor.submit(
+                self._capture_plan, engine, fingerprint, statement, parameters
+            )
+
+    def _capture_plan(self, engine: Engine, fingerprint, statement, parameters):
+        if engine.dialect.name == "postgresql":
+            prefix = "EXPLAIN (ANALYZE, BUFFERS) "
+        elif engine.dialect.name == "sqlite":
+            prefix = "EXPLAIN QUERY PLAN "
+        else:
+            return
+
+        try:
+            with engine.connect() as conn:
+                rows = (
+                    conn.execution_options(**{SKIP_OPTION: True})
+                    .exec_driver_sql(prefix + statement, parameters)
+                    .fetchall()
+                )
+                conn.rollback()
+        except Exception as e:
+            plan = f"EXPLAIN failed: {e}"
+        else:
+            plan = "\n".join(" ".join(str(column) for column in row) for row in rows)
+
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None:
+                entry.plan = plan
+
+    def wait_for_plans(self) -> None:
+        """Blocks until all queued EXPLAIN captures are finished"""
+        self._executor.submit(lambda: None).result()
+
+    def entries(self) -> List[dict]:
+        """Aggregated entries, the most expensive first"""
+        with self._lock:
+            entries = sorted(
+                self._entries.values(), key=lambda e: e.total_time, reverse=True
+            )
+            return [entry.as_dict() for entry in entries]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._planned.clear()
+
+
+slow_query_log = SlowQueryLog(threshold_ms=SLOW_QUERY_THRESHOLD_MS)
@@ -0,0 +1,45 @@
+from contextlib import contextmanager
+from functools import wraps
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """
+    Transaction scope of a use case
+
+    Nested scopes only flush, so their changes get database ids but stay in
+    the same transaction. The outermost scope commits once on success and
+    rolls back everything on error.
+    """
+    depth = db.info.get("unit_of_work_depth", 0)
+    db.info["unit_of_work_depth"] = depth + 1
+    try:
+        yield db
+        if depth:
+            db.flush()
+        else:
+            db.commit()
+    except Exception:
+        if not depth:
+            db.rollback()
+        raise
+    finally:
+        db.info["unit_of_work_depth"] = depth
+
+
+def transactional(func):
+    """Runs a service method inside a unit of work of its session"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        db = kwargs.get("db", args[0] if args else None)
+        if not isinstance(db, Session):
+            return func(*args, **kwargs)
+
+        with unit_of_work(db):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,42 @@
+from typing import Iterable, Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+ON_CONFLICT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def insert_or_ignore(
+    db: Session,
+    model,
+    values: dict,
+    index_elements: Iterable[str],
+    index_where=None,
+):
+    """
+    Inserts a row unless it conflicts with the given unique index.
+
+    Returns the new ORM object or None if a conflicting row already exists.
+    Uses INSERT ... ON CONFLICT DO NOTHING RETURNING where the dialect has it
+    and an insert inside a savepoint everywhere else.
+    """
+    insert = ON_CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        statement = (
+            insert(model)
+            .values(**values)
+            .on_conflict_do_nothing(
+                index_elements=list(index_elements), index_where=index_where
+            )
+            .returning(model)
+        )
+        return db.scalars(statement).first()
+
+    obj: Optional[object] = model(**values)
+    try:
+        with db.begin_nested():
+            db.add(obj)
+    except IntegrityError:
+        return None
+    return obj
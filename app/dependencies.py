@@ -1,12 +1,17 @@
-from fastapi import HTTPException, Request
+from fastapi import Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user_from_cookie
+from app.core.environs import ADMIN_EMAILS
 from app.db.database import SessionLocal
+from app.db.models import User
 
 
-def get_db() -> Session:
+def get_db(request: Request) -> Session:
     db = SessionLocal()
+    db.info["sticky_key"] = request.cookies.get("access_token") or request.headers.get(
+        "authorization"
+    )
     try:
         yield db
     finally:
@@ -18,3 +23,14 @@ def get_template_user(request: Request):
         return get_current_user_from_cookie(request)
     except HTTPException:
         return None
+
+
+def is_admin(user) -> bool:
+    """Checks whether the user may use admin tooling"""
+    return user is not None and user.email in ADMIN_EMAILS
+
+
+def get_admin_user(current_user: User = Depends(get_template_user)) -> User:
+    if not is_admin(current_user):
+        raise HTTPException(status_code=403, detail="Доступ запрещен")
+    return current_user
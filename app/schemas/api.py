@@ -0,0 +1,110 @@
+from datetime import datetime
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+T = TypeVar("T")
+
+
+class APIModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserPublicOut(APIModel):
+    id: int
+    username: Optional[str] = None
+    wishlist: Optional[str] = None
+
+
+class UserOut(UserPublicOut):
+    email: str
+    created_at: Optional[datetime] = None
+
+
+class GameOut(APIModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    budget: Optional[float] = None
+    event_date: Optional[datetime] = None
+    status: str
+    is_private: bool
+    organizer_id: int
+    participants_count: int
+    created_at: Optional[datetime] = None
+
+
+class GameBriefOut(APIModel):
+    id: int
+    title: str
+    status: str
+
+
+class ParticipantOut(APIModel):
+    id: int
+    user: UserPublicOut
+    joined_at: Optional[datetime] = None
+
+
+class DrawOut(APIModel):
+    id: int
+    created_at: Optional[datetime] = None
+
+
+class GameDetailOut(GameOut):
+    organizer: UserPublicOut
+    participants: List[ParticipantOut]
+    draws: List[DrawOut]
+
+
+class GiftOut(APIModel):
+    id: int
+    game_id: int
+    participant_id: int
+    receiver_participant_id: int
+    title: str
+    description: Optional[str] = None
+    price: Optional[float] = None
+    status: str
+    sent_at: Optional[datetime] = None
+    received_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+
+class GameGiftsOut(APIModel):
+    game: GameBriefOut
+    receiver: Optional[UserPublicOut] = None
+    my_gift: Optional[GiftOut] = None
+    gift_for_me: Optional[GiftOut] = None
+
+
+class JoinRequestOut(APIModel):
+    id: int
+    status: str
+    created_at: Optional[datetime] = None
+    user: UserPublicOut
+    game: GameBriefOut
+
+
+class JoinOut(APIModel):
+    game_id: int
+    participant_id: Optional[int] = None
+    join_request_id: Optional[int] = None
+
+
+class GiftStatusIn(BaseModel):
+    status: str
+
+
+class JoinIn(BaseModel):
+    secret_key: str
+
+
+class TokenOut(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
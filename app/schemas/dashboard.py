@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class GameProgress:
+    game_id: int
+    title: str
+    status: str
+    budget: Optional[float]
+    participants: int
+    givers: int
+    givers_with_gift: int
+    gifts_sent: int
+    gifts_received: int
+    average_price: Optional[float]
+
+    @property
+    def budget_usage(self) -> Optional[float]:
+        """Average gift price as a percentage of the game budget"""
+        if not self.budget or self.average_price is None:
+            return None
+        return round(self.average_price / self.budget * 100, 1)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from app.db.models import Game, Gift, Participant
+from app.db.models import Game, Gift, Participant, User
 
 
 @dataclass
@@ -10,3 +10,4 @@ class GameGiftView:
     participation: Participant
     my_gift: Optional[Gift]
     gift_for_me: Optional[Gift]
+    receiver: Optional[User] = None
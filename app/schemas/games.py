@@ -5,7 +5,7 @@ from typing import Optional, Union
 from sqlalchemy.orm import Session
 
 from app.constants import GameStatus
-from app.core.security import generate_secret_key_for_game
+from app.core.security import generate_secret_key
 
 NOT_PROVIDED = object()
 
@@ -23,8 +23,15 @@ class GameCreateData:
 
     @classmethod
     def from_db(cls, db: Session, **kwargs):
-        secret_key = generate_secret_key_for_game(db)
-        return cls(secret_key=secret_key, **kwargs)
+        """Kept for compatibility: the key no longer needs a database check"""
+        return cls(secret_key=generate_secret_key(), **kwargs)
+
+
+@dataclass(frozen=True)
+class GameKey:
+    id: int
+    organizer_id: int
+    is_private: bool
 
 
 @dataclass
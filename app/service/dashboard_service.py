@@ -0,0 +1,91 @@
+from typing import Iterable, List
+
+from sqlalchemy import case, distinct, func, select
+from sqlalchemy.orm import Session
+
+from app.constants import GiftStatus
+from app.core.cache import LRUCache
+from app.db.database import on_commit, read_only
+from app.db.models import Draw, DrawAssignment, Game, Gift, Participant
+from app.schemas.dashboard import GameProgress
+
+progress_cache = LRUCache("dashboard", maxsize=4096)
+
+
+class DashboardService:
+    @staticmethod
+    def invalidate(db: Session, game_id: int) -> None:
+        """Drops cached progress of the game once the transaction is committed"""
+        on_commit(db, lambda: progress_cache.delete(game_id))
+
+    @staticmethod
+    def _compute_progress(db: Session, game_ids: Iterable[int]) -> List[GameProgress]:
+        """Aggregates progress of the games in the database with one query"""
+        game_ids = list(game_ids)
+
+        givers = (
+            select(
+                Draw.game_id,
+                func.count(distinct(DrawAssignment.participant_from_id)).label(
+                    "givers"
+                ),
+            )
+            .join(DrawAssignment, DrawAssignment.draw_id == Draw.id)
+            .join(Participant, Participant.id == DrawAssignment.participant_from_id)
+            .where(Draw.game_id.in_(game_ids), Participant.is_deleted == False)
+            .group_by(Draw.game_id)
+            .subquery()
+        )
+        gifts = (
+            select(
+                Gift.game_id,
+                func.count(distinct(Gift.participant_id)).label("givers_with_gift"),
+                func.count(case((Gift.status == GiftStatus.SENT, 1))).label("sent"),
+                func.count(case((Gift.status == GiftStatus.RECEIVED, 1))).label(
+                    "received"
+                ),
+                func.avg(Gift.price).label("average_price"),
+            )
+            .where(Gift.game_id.in_(game_ids), Gift.is_deleted == False)
+            .group_by(Gift.game_id)
+            .subquery()
+        )
+
+        rows = db.execute(
+            select(
+                Game.id,
+                Game.title,
+                Game.status,
+                Game.budget,
+                Game.participants_count,
+                func.coalesce(givers.c.givers, 0),
+                func.coalesce(gifts.c.givers_with_gift, 0),
+                func.coalesce(gifts.c.sent, 0),
+                func.coalesce(gifts.c.received, 0),
+                gifts.c.average_price,
+            )
+            .outerjoin(givers, givers.c.game_id == Game.id)
+            .outerjoin(gifts, gifts.c.game_id == Game.id)
+            .where(Game.id.in_(game_ids))
+        ).all()
+
+        return [GameProgress(*row) for row in rows]
+
+    @staticmethod
+    @read_only
+    def get_organizer_dashboard(db: Session, organizer_id: int) -> List[GameProgress]:
+        """Progress of all games of the organizer, newest first"""
+        game_ids = db.scalars(
+            select(Game.id)
+            .where(Game.organizer_id == organizer_id, Game.is_deleted == False)
+            .order_by(Game.created_at.desc(), Game.id.desc())
+        ).all()
+
+        progress = {game_id: progress_cache.get(game_id) for game_id in game_ids}
+        missing = [game_id for game_id, item in progress.items() if item is None]
+        if missing:
+            for item in DashboardService._compute_progress(db, missing):
+                progress_cache.set(item.game_id, item)
+                progress[item.game_id] = item
+
+        return [progress[game_id] for game_id in game_ids if progress[game_id]]
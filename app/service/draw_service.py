@@ -5,6 +5,8 @@ from sqlalchemy.orm import Session
 
 from app.constants import NotificationsData
 from app.db.models import Draw, DrawAssignment, Game, Participant, User
+from app.db.unit_of_work import transactional
+from app.service.game_stats_service import GameStatsService
 from app.service.notification_service import NotificationService
 
 
@@ -38,6 +40,7 @@ class DrawService:
         )
 
     @staticmethod
+    @transactional
     def start_draw(db: Session, organizer_id: int, game_id: int) -> Draw:
         """Start gift draw for a game"""
         organizer = db.get(User, organizer_id)
@@ -59,29 +62,25 @@ class DrawService:
         db.add(draw)
         db.flush()
 
-        try:
-            assignments = DrawService._generate_assignments(participants)
-            for giver, receiver in assignments:
-                giver.assigned_to_id = receiver.id
-                db.add(giver)
-                assignment = DrawAssignment(
-                    draw_id=draw.id,
-                    participant_from_id=giver.id,
-                    participant_to_id=receiver.id,
-                )
-                db.add(assignment)
-
-            notification = NotificationService.create_notification(
-                db, game_id, NotificationsData.DRAW_IS_COMPLETED
+        assignments = DrawService._generate_assignments(participants)
+        for giver, receiver in assignments:
+            giver.assigned_to_id = receiver.id
+            db.add(giver)
+            assignment = DrawAssignment(
+                draw_id=draw.id,
+                participant_from_id=giver.id,
+                participant_to_id=receiver.id,
             )
+            db.add(assignment)
 
-            NotificationService.send_notification_to_users(
-                db, [giver.user_id for giver, _ in assignments], notification
-            )
+        notification = NotificationService.create_notification(
+            db, game_id, NotificationsData.DRAW_IS_COMPLETED
+        )
+
+        NotificationService.send_notification_to_users(
+            db, [giver.user_id for giver, _ in assignments], notification
+        )
 
-            db.commit()
-        except Exception as e:
-            db.rollback()
-            raise e
+        GameStatsService.adjust(db, game.id, draws_version=1)
 
         return draw
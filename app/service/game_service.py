@@ -1,16 +1,32 @@
 from datetime import datetime
 from typing import List, Optional, Union
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
-
-from app.constants import GameStatus, JoinRequestStatus, NotificationsData
-from app.db.models import Game, JoinRequest, Participant, User
-from app.schemas.games import NOT_PROVIDED, GameCreateData, GameUpdateData
+from sqlalchemy import func, select, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.constants import (
+    GameStatus,
+    JoinRequestStatus,
+    NotificationsData,
+    SecretKeyCache,
+    SecretKeyGeneration,
+)
+from app.core.cache import MISSING, LRUCache
+from app.core.security import generate_secret_key
+from app.db.database import on_commit, read_only
+from app.db.models import PENDING_REQUEST, Game, JoinRequest, Participant, User
+from app.db.pagination import apply_keyset
+from app.db.unit_of_work import transactional
+from app.db.upsert import insert_or_ignore
+from app.schemas.games import NOT_PROVIDED, GameCreateData, GameKey, GameUpdateData
 from app.schemas.join_requests import JoinResult
-from app.service.join_requset_service import JoinRequestService
+from app.service.game_stats_service import GameStatsService
 from app.service.notification_service import NotificationService
-from app.service.participant_service import ParticipantService
+
+secret_key_cache = LRUCache(
+    "secret_keys", maxsize=SecretKeyCache.MAX_SIZE, ttl=SecretKeyCache.TTL
+)
 
 
 class GameService:
@@ -34,6 +50,7 @@ class GameService:
         return event_date
 
     @staticmethod
+    @transactional
     def create_game(db: Session, game_data: GameCreateData) -> Game:
         """Method for creating game model in DB"""
         if len(game_data.title.strip()) < 2:
@@ -53,57 +70,137 @@ class GameService:
             description=game_data.description,
             budget=game_data.budget,
             event_date=game_data.event_date,
-            secret_key=game_data.secret_key,
+            secret_key=game_data.secret_key or generate_secret_key(),
             organizer_id=game_data.organizer_id,
             is_private=game_data.is_private,
             status=game_data.status.lower().strip(),
         )
-        db.add(game)
-        db.commit()
-        db.refresh(game)
+        GameService._insert_with_unique_key(db, game)
+        GameService._forget_secret_key(db, game.secret_key)
 
         return game
 
+    @staticmethod
+    def _insert_with_unique_key(db: Session, game: Game) -> None:
+        """
+        Inserts the game in a savepoint, generating a new secret key if the
+        current one is already taken by another game
+        """
+        for _ in range(SecretKeyGeneration.MAX_ATTEMPTS):
+            try:
+                with db.begin_nested():
+                    db.add(game)
+                return
+            except IntegrityError:
+                game.secret_key = generate_secret_key()
+
+        raise ValueError("Не удалось сгенерировать уникальный ключ игры")
+
+    @staticmethod
+    def _forget_secret_key(db: Session, secret_key: str) -> None:
+        """Drops the cached secret key once the transaction is committed"""
+        on_commit(db, lambda: secret_key_cache.delete(secret_key))
+
+    @staticmethod
+    def lookup_secret_key(db: Session, secret_key: str) -> Optional[GameKey]:
+        """
+        Resolves a secret key to the game it opens. Results are cached in
+        memory, unknown keys only for SecretKeyCache.NEGATIVE_TTL seconds
+        """
+        game_key = secret_key_cache.get(secret_key, MISSING)
+        if game_key is not MISSING:
+            return game_key
+
+        row = db.execute(
+            select(Game.id, Game.organizer_id, Game.is_private).where(
+                Game.secret_key == secret_key, Game.is_deleted == False
+            )
+        ).first()
+        if not row:
+            secret_key_cache.set(secret_key, None, ttl=SecretKeyCache.NEGATIVE_TTL)
+            return None
+
+        game_key = GameKey(*row)
+        secret_key_cache.set(secret_key, game_key)
+        return game_key
+
     @staticmethod
     def find_game_by_secret_key(db: Session, secret_key: str) -> Optional[Game]:
-        return db.query(Game).filter(Game.secret_key == secret_key).first_not_deleted()
+        game_key = GameService.lookup_secret_key(db, secret_key)
+        return db.get(Game, game_key.id) if game_key else None
 
     @staticmethod
+    @transactional
     def join_the_game(db: Session, user_id: int, secret_key: str) -> JoinResult:
         """
         A user joins a game:
             - if the game is private → creates a request and notifies the organizer;
             - if the game is public → adds a participant and notifies everyone.
-        """
 
-        game = GameService.find_game_by_secret_key(db, secret_key)
-        if not game:
+        The key is resolved from the cache, all other checks are made with a
+        single query and duplicates are rejected by unique indexes, so
+        concurrent joins of one user cannot both succeed.
+        """
+        game_key = GameService.lookup_secret_key(db, secret_key)
+        if not game_key:
             raise ValueError("Игра по такому секретному ключу не найдена")
 
-        if user_id == game.organizer_id:
+        if user_id == game_key.organizer_id:
             raise ValueError(
                 "Организатор не может присоединиться к своей игре в качестве участника"
             )
 
-        existing_participant = (
-            db.query(Participant).filter_by(user_id=user_id, game_id=game.id).first()
+        is_participant = (
+            select(Participant.id)
+            .where(Participant.user_id == user_id, Participant.game_id == Game.id)
+            .exists()
         )
-        if existing_participant:
-            raise ValueError("Вы уже участвуете в этой игре")
-
-        existing_request = (
-            db.query(JoinRequest)
-            .filter_by(
-                user_id=user_id, game_id=game.id, status=JoinRequestStatus.PENDING
+        has_pending_request = (
+            select(JoinRequest.id)
+            .where(
+                JoinRequest.user_id == user_id,
+                JoinRequest.game_id == Game.id,
+                JoinRequest.status == JoinRequestStatus.PENDING,
+                JoinRequest.is_deleted == False,
             )
-            .first()
+            .exists()
         )
-        if existing_request:
+        game = db.execute(
+            select(
+                Game.id,
+                Game.organizer_id,
+                Game.is_private,
+                is_participant.label("is_participant"),
+                has_pending_request.label("has_pending_request"),
+            ).where(Game.id == game_key.id, Game.is_deleted == False),
+            execution_options={"include_deleted": True},
+        ).first()
+        if not game:
+            secret_key_cache.delete(secret_key)
+            raise ValueError("Игра по такому секретному ключу не найдена")
+
+        if game.is_participant:
+            raise ValueError("Вы уже участвуете в этой игре")
+
+        if game.has_pending_request:
             raise ValueError("Вы уже подали заявку на вступление в эту игру")
 
         if game.is_private:
-            join_request = JoinRequestService.create_join_request(
-                db, user_id, game.id, game.organizer_id
+            join_request = insert_or_ignore(
+                db,
+                JoinRequest,
+                {
+                    "user_id": user_id,
+                    "game_id": game.id,
+                    "organizer_id": game.organizer_id,
+                },
+                index_elements=["user_id", "game_id"],
+                index_where=PENDING_REQUEST,
+            )
+            if join_request is None:
+                raise ValueError("Вы уже подали заявку на вступление в эту игру")
+            GameStatsService.request_status_changed(
+                db, game.id, None, JoinRequestStatus.PENDING
             )
 
             notification = NotificationService.create_notification(
@@ -120,7 +217,17 @@ class GameService:
                 receivers=receivers,
             )
         else:
-            participant = ParticipantService.create_participant(db, user_id, game.id)
+            participant = insert_or_ignore(
+                db,
+                Participant,
+                {"user_id": user_id, "game_id": game.id},
+                index_elements=["user_id", "game_id"],
+            )
+            if participant is None:
+                raise ValueError("Вы уже участвуете в этой игре")
+            GameStatsService.adjust(
+                db, game.id, participants_count=1, participants_version=1
+            )
 
             notification = NotificationService.create_notification(
                 db=db, game_id=game.id, text=NotificationsData.NEW_PARTICIPANT_IN_GAME
@@ -135,6 +242,7 @@ class GameService:
             )
 
     @staticmethod
+    @transactional
     def update_game_data(
         db: Session, game_id: int, new_game_data: GameUpdateData, organizer_id: int
     ) -> Game:
@@ -173,29 +281,80 @@ class GameService:
                 raise ValueError("Недопустимый статус игры")
             game.status = new_game_data.status.lower().strip()
 
-        db.commit()
-        db.refresh(game)
+        GameStatsService.game_changed(db, game.id)
+        GameService._forget_secret_key(db, game.secret_key)
 
         return game
 
     @staticmethod
-    def get_filtered_user_games(
-        db: Session, user_id: int, role: str = "all", game_status: str = "all"
-    ) -> List[Game]:
-        """Getting user games by filters"""
-        query = db.query(Game).not_deleted()
+    def _user_game_ids(user_id: int, role: str):
+        """
+        Select of ids of the games the user organizes and/or participates in.
+        UNION ALL of two index lookups instead of OR over an outer join
+        """
+        organized = select(Game.id).where(Game.organizer_id == user_id)
+        joined = select(Participant.game_id).where(
+            Participant.user_id == user_id, Participant.is_deleted == False
+        )
 
         if role == "organizer":
-            query = query.filter(Game.organizer_id == user_id)
+            return organized
         elif role == "participant":
-            query = query.join(Participant).filter(Participant.user_id == user_id)
+            return joined
         elif role == "all":
-            query = query.outerjoin(Participant).filter(
-                or_(Game.organizer_id == user_id, Participant.user_id == user_id)
-            )
+            return union_all(organized, joined)
         else:
             raise ValueError("Неверное значение для фильтрации")
 
+    @staticmethod
+    @read_only
+    def get_games_version(db: Session, user_id: int, role: str = "all"):
+        """
+        Cheap version of the user's games: last modification time, number of
+        games and sum of their versions. Changes whenever any of them changes
+        """
+        return db.execute(
+            select(
+                func.max(func.coalesce(Game.updated_at, Game.created_at)),
+                func.count(Game.id),
+                func.sum(Game.participants_version + Game.draws_version),
+                func.sum(Game.gifts_version),
+            ).where(
+                Game.id.in_(GameService._user_game_ids(user_id, role)),
+                Game.is_deleted == False,
+            )
+        ).one()
+
+    @staticmethod
+    @read_only
+    def get_game_version(db: Session, game_id: int):
+        """Last modification time and versions of the game, None if not found"""
+        return db.execute(
+            select(
+                func.coalesce(Game.updated_at, Game.created_at),
+                Game.participants_version,
+                Game.draws_version,
+                Game.gifts_version,
+            ).where(Game.id == game_id, Game.is_deleted == False)
+        ).first()
+
+    @staticmethod
+    @read_only
+    def get_filtered_user_games(
+        db: Session,
+        user_id: int,
+        role: str = "all",
+        game_status: str = "all",
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Game]:
+        """Getting user games by filters, newest first, optionally by pages"""
+        query = (
+            db.query(Game)
+            .not_deleted()
+            .filter(Game.id.in_(GameService._user_game_ids(user_id, role)))
+        )
+
         if game_status == GameStatus.ACTIVE:
             query = query.filter(Game.status == GameStatus.ACTIVE)
         elif game_status == GameStatus.DRAFT:
@@ -207,9 +366,10 @@ class GameService:
         else:
             raise ValueError("Неверное значение для фильтрации")
 
-        return query.distinct().order_by(Game.created_at.desc()).all()
+        return apply_keyset(query, Game.created_at, Game.id, cursor, limit).all()
 
     @staticmethod
+    @transactional
     def delete_game(db: Session, organizer_id: int, game_id: int) -> Optional[str]:
         """Delete game by soft delete"""
         organizer = db.get(User, organizer_id)
@@ -224,10 +384,12 @@ class GameService:
             raise ValueError("Данные действия доступны только организатору игры")
 
         game.soft_delete()
-        db.commit()
+        GameStatsService.game_changed(db, game.id)
+        GameService._forget_secret_key(db, game.secret_key)
         return "Игра успешно удалена"
 
     @staticmethod
+    @read_only
     def get_game_by_id(db: Session, game_id: int, user_id: int) -> Game:
         """Getting game by id"""
         game = db.query(Game).filter(Game.id == game_id).first_not_deleted()
@@ -243,3 +405,33 @@ class GameService:
             raise ValueError("Игра не найдена для пользователя")
 
         return game
+
+    @staticmethod
+    @read_only
+    def get_game_view(db: Session, game_id: int, user_id: int) -> Game:
+        """
+        Getting game for the game page with organizer, draws, participants,
+        their users and assigned receivers loaded in a fixed number of queries
+        """
+        game = (
+            db.query(Game)
+            .options(
+                joinedload(Game.organizer),
+                selectinload(Game.draws),
+                selectinload(Game.participants).options(
+                    joinedload(Participant.user),
+                    joinedload(Participant.assigned_to).joinedload(Participant.user),
+                ),
+            )
+            .filter(Game.id == game_id)
+            .first()
+        )
+        if not game:
+            raise ValueError("Игра не найдена")
+
+        if game.organizer_id != user_id and all(
+            participant.user_id != user_id for participant in game.participants
+        ):
+            raise ValueError("Игра не найдена для пользователя")
+
+        return game
@@ -0,0 +1,161 @@
+from typing import Iterable, Optional
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+from app.constants import GiftStatus, JoinRequestStatus
+from app.core.fragments import fragment_cache
+from app.db.database import on_commit
+from app.db.models import Game, Gift, JoinRequest, Participant
+from app.service.dashboard_service import DashboardService
+
+GIFT_STATUS_COUNTERS = {
+    GiftStatus.PLANNED: "gifts_planned_count",
+    GiftStatus.NOT_SENT: "gifts_not_sent_count",
+    GiftStatus.SENT: "gifts_sent_count",
+    GiftStatus.RECEIVED: "gifts_received_count",
+}
+
+REQUEST_STATUS_COUNTERS = {
+    JoinRequestStatus.PENDING: "requests_pending_count",
+    JoinRequestStatus.APPROVED: "requests_approved_count",
+    JoinRequestStatus.REJECTED: "requests_rejected_count",
+}
+
+
+class GameStatsService:
+    @staticmethod
+    def game_changed(db: Session, game_id: int) -> None:
+        """Drops cached progress and HTML fragments of the game after commit"""
+        DashboardService.invalidate(db, game_id)
+        on_commit(db, lambda: fragment_cache.invalidate_game(game_id))
+
+    @staticmethod
+    def adjust(db: Session, game_id: int, **deltas: int) -> None:
+        """
+        Changes counters of the game by the given deltas with a single
+        atomic UPDATE inside the caller's transaction. New values come back
+        with RETURNING and are put into an already loaded game, if any
+        """
+        values = {
+            counter: getattr(Game, counter) + delta
+            for counter, delta in deltas.items()
+            if delta
+        }
+        if not values:
+            return
+
+        statement = update(Game).where(Game.id == game_id).values(**values)
+        if not db.get_bind().dialect.update_returning:
+            db.execute(statement, execution_options={"synchronize_session": "evaluate"})
+        else:
+            returned = db.execute(
+                statement.returning(
+                    *[getattr(Game, c) for c in values], Game.updated_at
+                ),
+                execution_options={"synchronize_session": False},
+            ).one_or_none()
+            game = db.identity_map.get(identity_key(Game, game_id))
+            if returned is not None and game is not None:
+                for column, value in returned._mapping.items():
+                    set_committed_value(game, column, value)
+        GameStatsService.game_changed(db, game_id)
+
+    @staticmethod
+    def gift_status_changed(
+        db: Session, game_id: int, old_status: Optional[str], new_status: Optional[str]
+    ) -> None:
+        """Moves a gift between status counters (None - no gift)"""
+        if old_status == new_status:
+            return
+        deltas = {"gifts_version": 1}
+        if old_status in GIFT_STATUS_COUNTERS:
+            deltas[GIFT_STATUS_COUNTERS[old_status]] = -1
+        if new_status in GIFT_STATUS_COUNTERS:
+            deltas[GIFT_STATUS_COUNTERS[new_status]] = 1
+        GameStatsService.adjust(db, game_id, **deltas)
+
+    @staticmethod
+    def request_status_changed(
+        db: Session, game_id: int, old_status: Optional[str], new_status: Optional[str]
+    ) -> None:
+        """Moves a join request between status counters (None - no request)"""
+        if old_status == new_status:
+            return
+        deltas = {}
+        if old_status in REQUEST_STATUS_COUNTERS:
+            deltas[REQUEST_STATUS_COUNTERS[old_status]] = -1
+        if new_status in REQUEST_STATUS_COUNTERS:
+            deltas[REQUEST_STATUS_COUNTERS[new_status]] = 1
+        GameStatsService.adjust(db, game_id, **deltas)
+
+    @staticmethod
+    def touch_user_games(db: Session, user_id: int) -> None:
+        """
+        Bumps participants version of every game the user organizes or takes
+        part in, e.g. after their name or wishlist changed
+        """
+        joined = select(Participant.game_id).where(
+            Participant.user_id == user_id, Participant.is_deleted == False
+        )
+        game_ids = db.scalars(
+            select(Game.id).where(
+                or_(Game.organizer_id == user_id, Game.id.in_(joined))
+            )
+        ).all()
+        if not game_ids:
+            return
+
+        db.execute(
+            update(Game)
+            .where(Game.id.in_(game_ids))
+            .values(participants_version=Game.participants_version + 1),
+            execution_options={"synchronize_session": "evaluate"},
+        )
+        for game_id in game_ids:
+            GameStatsService.game_changed(db, game_id)
+
+    @staticmethod
+    def reconcile(db: Session, game_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Recomputes counters of the given games (all games by default) from
+        participants, gifts and join requests. Returns number of updated games
+        """
+        values = {
+            "participants_count": select(func.count(Participant.id))
+            .where(Participant.game_id == Game.id, Participant.is_deleted == False)
+            .scalar_subquery()
+        }
+        for status, counter in GIFT_STATUS_COUNTERS.items():
+            values[counter] = (
+                select(func.count(Gift.id))
+                .where(
+                    Gift.game_id == Game.id,
+                    Gift.is_deleted == False,
+                    Gift.status == status,
+                )
+                .scalar_subquery()
+            )
+        for status, counter in REQUEST_STATUS_COUNTERS.items():
+            values[counter] = (
+                select(func.count(JoinRequest.id))
+                .where(
+                    JoinRequest.game_id == Game.id,
+                    JoinRequest.is_deleted == False,
+                    JoinRequest.status == status,
+                )
+                .scalar_subquery()
+            )
+
+        for version in ("participants_version", "draws_version", "gifts_version"):
+            values[version] = getattr(Game, version) + 1
+
+        statement = update(Game).values(**values)
+        if game_ids is not None:
+            statement = statement.where(Game.id.in_(list(game_ids)))
+
+        result = db.execute(statement, execution_options={"synchronize_session": False})
+        db.expire_all()
+        return result.rowcount
@@ -1,17 +1,22 @@
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, contains_eager, joinedload
 
 from app.constants import GiftStatus
+from app.db.database import read_only
 from app.db.models import Game, Gift, Participant
+from app.db.pagination import apply_keyset
+from app.db.unit_of_work import transactional
 from app.schemas.game_gift_view import GameGiftView
 from app.schemas.gifts import GiftCreateData, GiftUpdateData
-from app.service.game_service import GameService
+from app.service.game_stats_service import GameStatsService
 
 
 class GiftService:
     @staticmethod
+    @transactional
     def create_gift(db: Session, gift_create_data: GiftCreateData) -> Gift:
         """Creating gift"""
         gift = Gift(
@@ -25,12 +30,12 @@ class GiftService:
         )
 
         db.add(gift)
-        db.commit()
-        db.refresh(gift)
+        GameStatsService.gift_status_changed(db, gift.game_id, None, gift.status)
 
         return gift
 
     @staticmethod
+    @transactional
     def update_gift_data(
         db: Session, new_gift_data: GiftUpdateData, gift_id: int
     ) -> Gift:
@@ -48,12 +53,13 @@ class GiftService:
         if new_gift_data.price != gift.price:
             gift.price = new_gift_data.price
 
-        db.commit()
-        db.refresh(gift)
+        if db.is_modified(gift):
+            GameStatsService.adjust(db, gift.game_id, gifts_version=1)
 
         return gift
 
     @staticmethod
+    @transactional
     def update_gift_status(
         db: Session, gift_id: int, participant_id: int, new_status: str
     ) -> Gift:
@@ -70,6 +76,7 @@ class GiftService:
         if new_status not in GiftStatus.ALL:
             raise ValueError("Недопустимый статус подарка")
 
+        GameStatsService.gift_status_changed(db, gift.game_id, gift.status, new_status)
         gift.status = new_status
 
         if new_status == GiftStatus.SENT:
@@ -77,12 +84,10 @@ class GiftService:
         elif new_status == GiftStatus.RECEIVED:
             gift.received_at = datetime.now(timezone.utc)
 
-        db.commit()
-        db.refresh(gift)
-
         return gift
 
     @staticmethod
+    @read_only
     def get_gifts_for_user_in_game(
         db: Session, user_id: int, game: Game
     ) -> Optional[GameGiftView]:
@@ -123,30 +128,80 @@ class GiftService:
         )
 
     @staticmethod
-    def get_user_gifts_overview(db: Session, user_id: int) -> list[GameGiftView]:
-        """Getting user gifts overview"""
-        games = GameService.get_filtered_user_games(
-            db=db, user_id=user_id, role="all", game_status="all"
+    @read_only
+    def get_user_gifts_overview(
+        db: Session,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[GameGiftView]:
+        """
+        Getting user gifts overview for user games (newest first, optionally
+        by pages) in a fixed number of queries: participations with games and
+        receivers, then gifts
+        """
+        query = (
+            db.query(Participant)
+            .join(Participant.game)
+            .options(
+                contains_eager(Participant.game),
+                joinedload(Participant.assigned_to).joinedload(Participant.user),
+            )
+            .filter(Participant.user_id == user_id)
+        )
+        participations = apply_keyset(
+            query, Game.created_at, Game.id, cursor, limit
+        ).all()
+        if not participations:
+            return []
+
+        participation_ids = {participation.id for participation in participations}
+        gifts = (
+            db.query(Gift)
+            .filter(
+                or_(
+                    Gift.participant_id.in_(participation_ids),
+                    Gift.receiver_participant_id.in_(participation_ids),
+                )
+            )
+            .order_by(Gift.id)
+            .all()
         )
 
-        result = []
-        for game in games:
-            view = GiftService.get_gifts_for_user_in_game(db, user_id, game)
-            if view:
-                result.append(view)
-
-        return result
+        my_gifts, gifts_for_me = {}, {}
+        for gift in gifts:
+            if gift.participant_id in participation_ids:
+                my_gifts.setdefault(gift.participant_id, gift)
+            if gift.receiver_participant_id in participation_ids:
+                gifts_for_me.setdefault(gift.receiver_participant_id, gift)
+
+        return [
+            GameGiftView(
+                game=participation.game,
+                participation=participation,
+                my_gift=my_gifts.get(participation.id),
+                gift_for_me=gifts_for_me.get(participation.id),
+                receiver=(
+                    participation.assigned_to.user
+                    if participation.assigned_to
+                    else None
+                ),
+            )
+            for participation in participations
+        ]
 
     @staticmethod
+    @read_only
     def get_gift_by_id(db: Session, gift_id: int) -> Gift:
         """Getting gift by id"""
         return db.query(Gift).filter(Gift.id == gift_id).first_not_deleted()
 
     @staticmethod
+    @transactional
     def delete_gift(db: Session, gift_id: int) -> Optional[str]:
         """Delete game by soft delete"""
         gift = db.query(Gift).filter(Gift.id == gift_id).first_not_deleted()
         gift.soft_delete()
-        db.commit()
+        GameStatsService.gift_status_changed(db, gift.game_id, gift.status, None)
 
         return "Подарок удален"
@@ -1,16 +1,21 @@
-from typing import List
+from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.constants import JoinRequestStatus, NotificationsData
+from app.db.database import read_only
 from app.db.models import Game, JoinRequest, User
+from app.db.pagination import apply_keyset
+from app.db.unit_of_work import transactional
 from app.schemas.join_requests import JoinResult
+from app.service.game_stats_service import GameStatsService
 from app.service.notification_service import NotificationService
 from app.service.participant_service import ParticipantService
 
 
 class JoinRequestService:
     @staticmethod
+    @transactional
     def create_join_request(
         db: Session, user_id: int, game_id: int, organizer_id: int
     ) -> JoinRequest:
@@ -34,39 +39,55 @@ class JoinRequestService:
         )
 
         db.add(join_request)
-        db.commit()
-        db.refresh(join_request)
+        GameStatsService.request_status_changed(
+            db, game_id, None, JoinRequestStatus.PENDING
+        )
 
         return join_request
 
     @staticmethod
-    def get_user_join_requests(db: Session, user_id: int) -> List[JoinRequest]:
-        """Get all join requests sent by user"""
-        return (
+    @read_only
+    def get_user_join_requests(
+        db: Session,
+        user_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[JoinRequest]:
+        """Get join requests sent by user, newest first, optionally by pages"""
+        query = (
             db.query(JoinRequest)
+            .options(joinedload(JoinRequest.game).joinedload(Game.organizer))
             .filter(JoinRequest.user_id == user_id)
-            .order_by(JoinRequest.created_at.desc())
             .not_deleted()
-            .all()
         )
+        return apply_keyset(
+            query, JoinRequest.created_at, JoinRequest.id, cursor, limit
+        ).all()
 
     @staticmethod
+    @read_only
     def get_pending_requests_for_organizer(
-        db: Session, organizer_id: int
+        db: Session,
+        organizer_id: int,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[JoinRequest]:
-        """Get pending join requests for organizer's games"""
-        return (
+        """Get pending join requests for organizer's games, optionally by pages"""
+        query = (
             db.query(JoinRequest)
+            .options(joinedload(JoinRequest.user), joinedload(JoinRequest.game))
             .filter(
                 JoinRequest.organizer_id == organizer_id,
                 JoinRequest.status == JoinRequestStatus.PENDING,
             )
-            .order_by(JoinRequest.created_at.desc())
             .not_deleted()
-            .all()
         )
+        return apply_keyset(
+            query, JoinRequest.created_at, JoinRequest.id, cursor, limit
+        ).all()
 
     @staticmethod
+    @transactional
     def approve_join_request(
         db: Session, request_id: int, organizer_id: int
     ) -> JoinResult:
@@ -84,6 +105,12 @@ class JoinRequestService:
         if not join_request:
             raise ValueError("Заявка не найдена или уже обработана")
 
+        GameStatsService.request_status_changed(
+            db,
+            join_request.game_id,
+            join_request.status,
+            JoinRequestStatus.APPROVED,
+        )
         join_request.status = JoinRequestStatus.APPROVED
 
         participant = ParticipantService.create_participant(
@@ -98,8 +125,6 @@ class JoinRequestService:
             db, [join_request.user_id], notification
         )
 
-        db.commit()
-
         return JoinResult(
             participant=participant,
             receivers=receiver,
@@ -108,6 +133,7 @@ class JoinRequestService:
         )
 
     @staticmethod
+    @transactional
     def reject_join_request(
         db: Session, request_id: int, organizer_id: int
     ) -> JoinRequest:
@@ -125,8 +151,12 @@ class JoinRequestService:
         if not join_request:
             raise ValueError("Заявка не найдена или уже обработана")
 
+        GameStatsService.request_status_changed(
+            db,
+            join_request.game_id,
+            join_request.status,
+            JoinRequestStatus.REJECTED,
+        )
         join_request.status = JoinRequestStatus.REJECTED
-        db.commit()
-        db.refresh(join_request)
 
         return join_request
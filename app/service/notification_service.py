@@ -3,19 +3,20 @@ from typing import List
 from sqlalchemy.orm import Session
 
 from app.db.models import Game, Notification, NotificationReceiver, User
+from app.db.unit_of_work import transactional
 
 
 class NotificationService:
     @staticmethod
+    @transactional
     def create_notification(db: Session, game_id: int, text: str) -> Notification:
         """Creates the notification itself (without assigning recipients)"""
         notification = Notification(game_id=game_id, text=text)
         db.add(notification)
-        db.commit()
-        db.refresh(notification)
         return notification
 
     @staticmethod
+    @transactional
     def send_notification_to_users(
         db: Session, user_ids: List[int], notification: Notification
     ) -> List[NotificationReceiver]:
@@ -25,5 +26,4 @@ class NotificationService:
             for user_id in user_ids
         ]
         db.add_all(receivers)
-        db.commit()
         return receivers
@@ -1,6 +1,10 @@
+from typing import Optional
+
 from sqlalchemy.orm import Session
 
 from app.db.models import Participant
+from app.db.unit_of_work import transactional
+from app.service.game_stats_service import GameStatsService
 
 
 class ParticipantService:
@@ -8,11 +12,15 @@ class ParticipantService:
     def user_already_in_game(db: Session, user_id: int, game_id: int) -> bool:
         """Check that the user in game or not"""
         return (
-            db.query(Participant).filter_by(user_id=user_id, game_id=game_id).first()
+            db.query(Participant)
+            .filter_by(user_id=user_id, game_id=game_id)
+            .with_deleted()
+            .first()
             is not None
         )
 
     @staticmethod
+    @transactional
     def create_participant(db: Session, user_id: int, game_id: int) -> Participant:
         """Create participant for game"""
         if ParticipantService.user_already_in_game(db, user_id, game_id):
@@ -24,11 +32,23 @@ class ParticipantService:
         )
 
         db.add(participant)
-        db.commit()
-        db.refresh(participant)
+        GameStatsService.adjust(
+            db, game_id, participants_count=1, participants_version=1
+        )
 
         return participant
 
+    @staticmethod
+    def get_participant_in_game(
+        db: Session, user_id: int, game_id: int
+    ) -> Optional[Participant]:
+        """Getting participation of the user in the game"""
+        return (
+            db.query(Participant)
+            .filter(Participant.user_id == user_id, Participant.game_id == game_id)
+            .first()
+        )
+
     @staticmethod
     def get_participant_by_user_id(db: Session, user_id: int) -> Participant:
         """Getting participant by user id"""
@@ -4,11 +4,14 @@ from sqlalchemy.orm import Session
 
 from app.core.security import hash_password
 from app.db.models import User
+from app.db.unit_of_work import transactional
 from app.schemas.users import UserCreateData, UserUpdateData
+from app.service.game_stats_service import GameStatsService
 
 
 class UserService:
     @staticmethod
+    @transactional
     def create_user(
         db: Session,
         user_data: UserCreateData,
@@ -33,11 +36,10 @@ class UserService:
             password_hash=hashed_password,
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
         return user
 
     @staticmethod
+    @transactional
     def update_user_data(
         db: Session, user_id: int, new_user_data: UserUpdateData
     ) -> User:
@@ -54,31 +56,33 @@ class UserService:
                 raise ValueError("Некорректный email")
             user.email = new_user_data.email
 
-        db.commit()
-        db.refresh(user)
+        if db.is_modified(user):
+            GameStatsService.touch_user_games(db, user.id)
 
         return user
 
     @staticmethod
+    @transactional
     def update_wishlist(db: Session, user_id: int, wishlist_text: str) -> User:
         """Update user wishlist"""
         user = db.query(User).filter(User.id == user_id).first_not_deleted()
         if not user:
             raise ValueError("Пользователь не найден")
 
-        user.wishlist = wishlist_text
-
-        db.commit()
-        db.refresh(user)
+        if user.wishlist != wishlist_text:
+            user.wishlist = wishlist_text
+            GameStatsService.touch_user_games(db, user.id)
 
         return user
 
     @staticmethod
+    @transactional
     def delete_user(db: Session, user_id: int) -> Optional[str]:
         """Delete user by soft delete"""
         user = db.get(User, user_id)
         if not user:
             raise ValueError("Пользователь не найден")
+        game_ids = [participant.game_id for participant in user.participation]
         user.soft_delete()
-        db.commit()
+        GameStatsService.reconcile(db, game_ids)
         return "Пользователь успешно удален"
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends
+
+from app.core.cache import get_caches
+from app.core.environs import SLOW_QUERY_LOG, SLOW_QUERY_THRESHOLD_MS
+from app.db.models import User
+from app.db.slow_queries import slow_query_log
+from app.dependencies import get_admin_user
+
+router = APIRouter(prefix="/admin")
+
+
+@router.get("/slow-queries")
+async def slow_queries(current_user: User = Depends(get_admin_user)):
+    """Slow statements aggregated by fingerprint"""
+    return {
+        "enabled": SLOW_QUERY_LOG,
+        "threshold_ms": SLOW_QUERY_THRESHOLD_MS,
+        "entries": slow_query_log.entries(),
+    }
+
+
+@router.get("/caches")
+async def caches(current_user: User = Depends(get_admin_user)):
+    """Size and hit ratio of in-process caches"""
+    return [cache.stats() for cache in get_caches()]
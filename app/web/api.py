@@ -0,0 +1,279 @@
+"""
+JSON API for the mobile app and integrations.
+
+Endpoints are plain functions, so FastAPI runs the blocking service calls in
+its threadpool instead of the event loop. Every list supports `fields` -
+comma separated top-level fields to return - and cursor pagination.
+"""
+
+from typing import Callable, Iterable, Optional, Type
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.orm import Session
+
+from app.constants import Pagination
+from app.core.auth import get_current_user, login_user
+from app.db.models import User
+from app.db.pagination import split_page
+from app.dependencies import get_db
+from app.schemas.api import (
+    APIModel,
+    GameDetailOut,
+    GameGiftsOut,
+    GameOut,
+    GiftOut,
+    GiftStatusIn,
+    JoinIn,
+    JoinOut,
+    JoinRequestOut,
+    Page,
+    TokenOut,
+    UserOut,
+)
+from app.schemas.join_requests import NULL_DATA
+from app.service.draw_service import DrawService
+from app.service.game_service import GameService
+from app.service.gift_service import GiftService
+from app.service.join_requset_service import JoinRequestService
+from app.service.participant_service import ParticipantService
+
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as APIResponse
+except ImportError:
+    APIResponse = JSONResponse
+
+router = APIRouter(prefix="/api/v1", default_response_class=APIResponse)
+
+PageLimit = Query(Pagination.PAGE_SIZE, ge=1, le=Pagination.MAX_PAGE_SIZE)
+
+
+def parse_fields(fields: Optional[str], model: Type[APIModel]) -> Optional[set]:
+    """Top-level fields selected by the client, None - all fields"""
+    if not fields:
+        return None
+    selected = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = selected - set(model.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Неизвестные поля: {', '.join(sorted(unknown))}"
+        )
+    return selected
+
+
+def dump(model: Type[APIModel], obj, include: Optional[set] = None) -> dict:
+    return model.model_validate(obj).model_dump(mode="json", include=include)
+
+
+def page_response(
+    model: Type[APIModel],
+    items: Iterable,
+    limit: int,
+    include: Optional[set],
+    key: Callable = lambda item: item,
+) -> APIResponse:
+    items, next_cursor = split_page(list(items), limit, key=key)
+    return APIResponse(
+        {
+            "items": [dump(model, item, include) for item in items],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+def call_service(func: Callable, *args, **kwargs):
+    """Calls a service method turning its validation errors into 400"""
+    try:
+        return func(*args, **kwargs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/token", response_model=TokenOut)
+def issue_token(form: OAuth2PasswordRequestForm = Depends()):
+    """Bearer token for the API, `username` is the user email"""
+    try:
+        return TokenOut(access_token=login_user(form.username, form.password))
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+
+@router.get("/me", response_model=UserOut)
+def me(current_user: User = Depends(get_current_user)):
+    return APIResponse(dump(UserOut, current_user))
+
+
+@router.get("/games", response_model=Page[GameOut])
+def games(
+    role: str = "all",
+    status: str = "all",
+    cursor: Optional[str] = None,
+    limit: int = PageLimit,
+    fields: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Games of the user with filtering, newest first"""
+    include = parse_fields(fields, GameOut)
+    items = call_service(
+        GameService.get_filtered_user_games,
+        db,
+        user_id=current_user.id,
+        role=role,
+        game_status=status,
+        cursor=cursor,
+        limit=limit + 1,
+    )
+    return page_response(GameOut, items, limit, include)
+
+
+@router.get("/games/{game_id}", response_model=GameDetailOut)
+def game(
+    game_id: int,
+    fields: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    include = parse_fields(fields, GameDetailOut)
+    game = call_service(GameService.get_game_view, db, game_id, current_user.id)
+    return APIResponse(dump(GameDetailOut, game, include))
+
+
+@router.post("/games/join", response_model=JoinOut)
+def join_game(
+    data: JoinIn,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Joins a public game or sends a join request to a private one"""
+    result = call_service(
+        GameService.join_the_game, db, current_user.id, data.secret_key
+    )
+    if result.join_request is not NULL_DATA:
+        joined = JoinOut(
+            game_id=result.join_request.game_id,
+            join_request_id=result.join_request.id,
+        )
+    else:
+        joined = JoinOut(
+            game_id=result.participant.game_id, participant_id=result.participant.id
+        )
+    return APIResponse(joined.model_dump())
+
+
+@router.post("/games/{game_id}/draw", response_model=GameDetailOut)
+def start_draw(
+    game_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    call_service(DrawService.start_draw, db, current_user.id, game_id)
+    game = GameService.get_game_view(db, game_id, current_user.id)
+    return APIResponse(dump(GameDetailOut, game))
+
+
+@router.get("/gifts", response_model=Page[GameGiftsOut])
+def gifts(
+    cursor: Optional[str] = None,
+    limit: int = PageLimit,
+    fields: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Gifts of the user in every game they take part in"""
+    include = parse_fields(fields, GameGiftsOut)
+    items = call_service(
+        GiftService.get_user_gifts_overview,
+        db,
+        current_user.id,
+        cursor=cursor,
+        limit=limit + 1,
+    )
+    return page_response(GameGiftsOut, items, limit, include, key=lambda v: v.game)
+
+
+@router.post("/gifts/{gift_id}/status", response_model=GiftOut)
+def update_gift_status(
+    gift_id: int,
+    data: GiftStatusIn,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    gift = GiftService.get_gift_by_id(db, gift_id)
+    if not gift:
+        raise HTTPException(status_code=404, detail="Подарок не найден")
+    participant = ParticipantService.get_participant_in_game(
+        db, current_user.id, gift.game_id
+    )
+    if not participant:
+        raise HTTPException(status_code=404, detail="Подарок не найден")
+    gift = call_service(
+        GiftService.update_gift_status, db, gift_id, participant.id, data.status
+    )
+    return APIResponse(dump(GiftOut, gift))
+
+
+@router.get("/requests/pending", response_model=Page[JoinRequestOut])
+def pending_requests(
+    cursor: Optional[str] = None,
+    limit: int = PageLimit,
+    fields: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Join requests waiting for the organizer's decision"""
+    include = parse_fields(fields, JoinRequestOut)
+    items = call_service(
+        JoinRequestService.get_pending_requests_for_organizer,
+        db,
+        current_user.id,
+        cursor=cursor,
+        limit=limit + 1,
+    )
+    return page_response(JoinRequestOut, items, limit, include)
+
+
+@router.get("/requests/sent", response_model=Page[JoinRequestOut])
+def sent_requests(
+    cursor: Optional[str] = None,
+    limit: int = PageLimit,
+    fields: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Join requests sent by the user"""
+    include = parse_fields(fields, JoinRequestOut)
+    items = call_service(
+        JoinRequestService.get_user_join_requests,
+        db,
+        current_user.id,
+        cursor=cursor,
+        limit=limit + 1,
+    )
+    return page_response(JoinRequestOut, items, limit, include)
+
+
+@router.post("/requests/{request_id}/approve", response_model=JoinRequestOut)
+def approve_request(
+    request_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    result = call_service(
+        JoinRequestService.approve_join_request, db, request_id, current_user.id
+    )
+    return APIResponse(dump(JoinRequestOut, result.join_request))
+
+
+@router.post("/requests/{request_id}/reject", response_model=JoinRequestOut)
+def reject_request(
+    request_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    join_request = call_service(
+        JoinRequestService.reject_join_request, db, request_id, current_user.id
+    )
+    return APIResponse(dump(JoinRequestOut, join_request))
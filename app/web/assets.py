@@ -0,0 +1,172 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from mimetypes import guess_type
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.constants import StaticAssets
+from app.core.environs import DEBUG
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+_IMPORT = re.compile(r"""@import\s+(?:url\(\s*)?['"]?([^'")\s]+)['"]?\s*\)?[^;]*;""")
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+_SPACE_AROUND = re.compile(r"\s*([{};,>])\s*")
+_FINGERPRINTED = re.compile(rf"\.[0-9a-f]{{{StaticAssets.FINGERPRINT_LENGTH}}}\.\w+$")
+ENCODINGS: List[Tuple[str, str]] = [("gzip", ".gz")]
+if brotli is not None:
+    ENCODINGS.insert(0, ("br", ".br"))
+
+
+def bundle_css(path: str) -> str:
+    """
+    Inlines local @import rules of the stylesheet recursively. Relative
+    url(...) references of imported files are not rewritten
+    """
+    directory = os.path.dirname(path)
+    with open(path, encoding="utf-8") as f:
+        css = f.read()
+
+    def inline(match: re.Match) -> str:
+        target = match.group(1)
+        if "//" in target:
+            return match.group(0)
+        return bundle_css(os.path.join(directory, target))
+
+    return _IMPORT.sub(inline, css)
+
+
+def minify_css(css: str) -> str:
+    """Drops comments and insignificant whitespace, keeping strings intact"""
+    parts = _STRING.split(_COMMENT.sub("", css))
+    for i in range(0, len(parts), 2):
+        code = " ".join(parts[i].split())
+        code = _SPACE_AROUND.sub(r"\1", code).replace(";}", "}")
+        parts[i] = code.replace(": ", ":")
+    return "".join(parts).strip()
+
+
+def _write(path: str, content: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def build_assets(
+    directory: str = StaticAssets.DIRECTORY,
+    entry_points: Optional[List[str]] = None,
+) -> Dict[str, str]:
+    """
+    Bundles and minifies entry stylesheets into fingerprinted files of the
+    build directory next to their .gz (and .br if brotli is installed)
+    copies. Returns the manifest: source name -> fingerprinted name
+    """
+    build_directory = os.path.join(directory, StaticAssets.BUILD_DIRECTORY)
+    os.makedirs(build_directory, exist_ok=True)
+
+    manifest = {}
+    for entry in entry_points or StaticAssets.ENTRY_POINTS:
+        content = minify_css(bundle_css(os.path.join(directory, entry))).encode()
+        digest = hashlib.sha256(content).hexdigest()[: StaticAssets.FINGERPRINT_LENGTH]
+        name, extension = os.path.splitext(os.path.basename(entry))
+        fingerprinted = f"{name}.{digest}{extension}"
+        path = os.path.join(build_directory, fingerprinted)
+
+        _write(path, content)
+        _write(path + ".gz", gzip.compress(content, compresslevel=9, mtime=0))
+        if brotli is not None:
+            _write(path + ".br", brotli.compress(content))
+        manifest[entry] = f"{StaticAssets.BUILD_DIRECTORY}/{fingerprinted}"
+
+    with open(os.path.join(build_directory, StaticAssets.MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+@lru_cache(maxsize=None)
+def load_manifest(directory: str = StaticAssets.DIRECTORY) -> Dict[str, str]:
+    """Manifest of the last build, empty if assets were never built"""
+    path = os.path.join(directory, StaticAssets.BUILD_DIRECTORY, StaticAssets.MANIFEST)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def static_url(path: str) -> str:
+    """URL of a static file, fingerprinted one if it was built (not in DEBUG)"""
+    if not DEBUG:
+        path = load_manifest().get(path, path)
+    return f"/static/{path}"
+
+
+def accepted_encodings(headers: Headers) -> List[str]:
+    """Content codings from Accept-Encoding that the client did not refuse"""
+    accepted = []
+    for item in headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.append(coding.strip().lower())
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves a precompressed .br/.gz sibling of the file when
+    the client accepts it. Fingerprinted files are cached forever, the rest
+    is revalidated with ETag/Last-Modified on every use
+    """
+
+    def file_response(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        accepted = accepted_encodings(request_headers)
+
+        response = None
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            try:
+                compressed_stat = os.stat(f"{full_path}{suffix}")
+            except FileNotFoundError:
+                continue
+            response = FileResponse(
+                f"{full_path}{suffix}",
+                status_code=status_code,
+                stat_result=compressed_stat,
+                media_type=guess_type(full_path)[0] or "text/plain",
+                headers={"Content-Encoding": encoding},
+            )
+            break
+        if response is None:
+            response = FileResponse(
+                full_path, status_code=status_code, stat_result=stat_result
+            )
+
+        response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = (
+            StaticAssets.IMMUTABLE_CACHE_CONTROL
+            if _FINGERPRINTED.search(str(full_path))
+            else StaticAssets.REVALIDATE_CACHE_CONTROL
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
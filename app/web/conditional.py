@@ -0,0 +1,97 @@
+"""
+HTTP conditional requests for pages built from game data.
+
+Pages get a weak ETag computed from cheap version columns (``updated_at`` and
+the per-game participants/draws/gifts versions) instead of the rendered
+body, so an unchanged page is answered with 304 before any template work.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Sequence
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def _templates_version(directory: str = "templates") -> str:
+    """Changes whenever a template is deployed, so old ETags stop matching"""
+    mtimes = [
+        os.stat(os.path.join(root, name)).st_mtime_ns
+        for root, _, names in os.walk(directory)
+        for name in names
+    ]
+    return str(max(mtimes, default=0))
+
+
+TEMPLATES_VERSION = _templates_version()
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Database datetimes are naive UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def build(cls, last_modified: Optional[datetime], *parts) -> "Validators":
+        digest = hashlib.sha1(repr((TEMPLATES_VERSION, *parts)).encode()).hexdigest()
+        return cls(f'W/"{digest[:20]}"', last_modified)
+
+    @classmethod
+    def for_user(cls, user, version: Optional[Sequence], *parts) -> "Validators":
+        """
+        Validators of a page rendered for the user. `version` is a row whose
+        first column is the last modification time of the shown data
+        """
+        version = tuple(version or ())
+        modified = [m for m in (version[:1] + (user.updated_at,)) if m is not None]
+        return cls.build(
+            max(modified, default=None), user.id, user.updated_at, *version, *parts
+        )
+
+    def headers(self) -> dict:
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": "private, no-cache",
+            "Vary": "Cookie",
+        }
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                _as_utc(self.last_modified), usegmt=True
+            )
+        return headers
+
+    def matches(self, request: Request) -> bool:
+        """Whether the client's cached copy is still fresh"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip() for tag in if_none_match.split(",")}
+            return bool({"*", self.etag, self.etag[2:]} & tags)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        return _as_utc(self.last_modified).replace(microsecond=0) <= since
+
+    def not_modified(self) -> Response:
+        return Response(status_code=304, headers=self.headers())
+
+    def apply(self, response: Response) -> Response:
+        response.headers.update(self.headers())
+        return response
@@ -1,14 +1,47 @@
+import logging
+
 from fastapi import FastAPI
-from starlette.staticfiles import StaticFiles
 
-from app.web import routes
+from app.constants import StaticAssets
+from app.core.environs import (
+    COMPRESSION_LEVEL,
+    COMPRESSION_MINIMUM_SIZE,
+    DEBUG,
+    SLOW_QUERY_LOG,
+)
+from app.db.database import engine, replica_engines
+from app.db.query_stats import install_query_stats
+from app.db.slow_queries import slow_query_log
+from app.web import admin, api, routes
+from app.web.assets import PrecompressedStaticFiles
+from app.web.middleware import CompressionMiddleware, QueryStatsMiddleware
 
 
 def create_app() -> FastAPI:
     """
     Factory for creating a FastAPI Secret Santa application
     """
+    if DEBUG:
+        logging.basicConfig(level=logging.INFO)
+
+    for db_engine in [engine, *replica_engines]:
+        install_query_stats(db_engine)
+        if SLOW_QUERY_LOG:
+            slow_query_log.install(db_engine)
+
     app = FastAPI(title="SecretSanta", log_level="debug")
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+    app.add_middleware(QueryStatsMiddleware, debug=DEBUG)
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=COMPRESSION_MINIMUM_SIZE,
+        level=COMPRESSION_LEVEL,
+    )
+    app.mount(
+        "/static",
+        PrecompressedStaticFiles(directory=StaticAssets.DIRECTORY),
+        name="static",
+    )
     app.include_router(routes.router)
+    app.include_router(admin.router)
+    app.include_router(api.router)
     return app
@@ -0,0 +1,93 @@
+import logging
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    Counts SQL statements of every request
+
+    The count and total DB time go to the X-DB-Query-Count / X-DB-Query-Time
+    response headers; in debug mode the slowest and repeated (N+1) statements
+    are logged as well.
+    """
+
+    def __init__(self, app: ASGIApp, debug: bool = False) -> None:
+        self.app = app
+        self.debug = debug
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            scope.setdefault("state", {})["query_stats"] = stats
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.count)
+                    headers["X-DB-Query-Time"] = f"{stats.total_time * 1000:.1f}ms"
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+        if self.debug:
+            logger.info("%s %s: %s", scope["method"], scope["path"], stats.report())
+        elif stats.repeated_statements():
+            logger.warning(
+                "%s %s: possible N+1 queries: %s",
+                scope["method"],
+                scope["path"],
+                stats.repeated_statements(),
+            )
+
+
+class StreamingGZipResponder(GZipResponder):
+    """GZip responder that flushes the compressor after every streamed chunk"""
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if not more_body:
+            return super().apply_compression(body, more_body=False)
+
+        self.gzip_file.write(body)
+        self.gzip_file.flush()
+        body = self.gzip_buffer.getvalue()
+        self.gzip_buffer.seek(0)
+        self.gzip_buffer.truncate()
+        return body
+
+
+class CompressionMiddleware:
+    """
+    Gzips responses of at least `minimum_size` bytes for clients that accept it
+
+    Unlike starlette's GZipMiddleware every chunk of a streaming response is
+    flushed right away, so streamed pages still reach the client early.
+    Already encoded responses (precompressed static files) are left as is.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, level: int = 6) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if "gzip" in Headers(scope=scope).get("accept-encoding", ""):
+            responder = StreamingGZipResponder(
+                self.app, self.minimum_size, compresslevel=self.level
+            )
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
@@ -6,23 +6,25 @@ from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from starlette.responses import HTMLResponse, RedirectResponse
-from starlette.templating import Jinja2Templates
 
+from app.constants import Pagination
 from app.core.auth import login_user
 from app.db.models import User
+from app.db.pagination import split_page
 from app.dependencies import get_db, get_template_user
 from app.schemas.games import GameCreateData, GameUpdateData
 from app.schemas.gifts import GiftCreateData, GiftUpdateData
 from app.schemas.join_requests import NULL_DATA
 from app.schemas.users import UserCreateData, UserUpdateData
+from app.service.dashboard_service import DashboardService
 from app.service.draw_service import DrawService
 from app.service.game_service import GameService
 from app.service.gift_service import GiftService
 from app.service.join_requset_service import JoinRequestService
 from app.service.participant_service import ParticipantService
 from app.service.user_service import UserService
-
-templates = Jinja2Templates(directory="templates")
+from app.web.conditional import Validators
+from app.web.templating import stream_template, templates
 
 router = APIRouter()
 
@@ -172,25 +174,47 @@ async def user_games(
     request: Request,
     role: str = "all",
     status: str = "all",
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_template_user),
     db: Session = Depends(get_db),
 ):
     """User's games list with filtering"""
     try:
-        games = GameService.get_filtered_user_games(
-            db, user_id=current_user.id, role=role, game_status=status
+        validators = Validators.for_user(
+            current_user,
+            GameService.get_games_version(db, current_user.id),
+            "games",
+            request.url.query,
+            request.cookies.get("new_game_key"),
+        )
+        if validators.matches(request):
+            return validators.not_modified()
+
+        games, next_cursor = split_page(
+            GameService.get_filtered_user_games(
+                db,
+                user_id=current_user.id,
+                role=role,
+                game_status=status,
+                cursor=cursor,
+                limit=Pagination.PAGE_SIZE + 1,
+            ),
+            Pagination.PAGE_SIZE,
         )
 
-        return templates.TemplateResponse(
-            "games.html",
-            {
-                "request": request,
-                "current_user": current_user,
-                "games": games,
-                "current_role": role,
-                "current_status": status,
-                "new_game_key": request.cookies.get("new_game_key"),
-            },
+        return validators.apply(
+            templates.TemplateResponse(
+                "games.html",
+                {
+                    "request": request,
+                    "current_user": current_user,
+                    "games": games,
+                    "next_cursor": next_cursor,
+                    "current_role": role,
+                    "current_status": status,
+                    "new_game_key": request.cookies.get("new_game_key"),
+                },
+            )
         )
 
     except ValueError as e:
@@ -207,6 +231,21 @@ async def user_games(
         )
 
 
+@router.get("/dashboard", response_class=HTMLResponse)
+async def organizer_dashboard(
+    request: Request,
+    current_user: User = Depends(get_template_user),
+    db: Session = Depends(get_db),
+):
+    """Progress of the games organized by the user"""
+    progress = DashboardService.get_organizer_dashboard(db, current_user.id)
+
+    return templates.TemplateResponse(
+        "dashboard.html",
+        {"request": request, "current_user": current_user, "progress": progress},
+    )
+
+
 @router.post("/create-game", response_class=HTMLResponse)
 async def create_game_submit(
     request: Request,
@@ -295,11 +334,19 @@ async def get_game(
 ):
     """View game page"""
     try:
-        game = GameService.get_game_by_id(db, game_id, current_user.id)
+        validators = Validators.for_user(
+            current_user, GameService.get_game_version(db, game_id), "game", game_id
+        )
+        if validators.matches(request):
+            return validators.not_modified()
 
-        return templates.TemplateResponse(
-            "game-view.html",
-            {"request": request, "current_user": current_user, "game": game},
+        game = GameService.get_game_view(db, game_id, current_user.id)
+
+        return validators.apply(
+            stream_template(
+                "game-view.html",
+                {"request": request, "current_user": current_user, "game": game},
+            )
         )
     except Exception as e:
         return templates.TemplateResponse(
@@ -397,15 +444,31 @@ async def join_game_submit(
 @router.get("/requests", response_class=HTMLResponse)
 async def view_requests(
     request: Request,
+    sent_cursor: Optional[str] = None,
+    pending_cursor: Optional[str] = None,
     current_user: User = Depends(get_template_user),
     db: Session = Depends(get_db),
 ):
     """View request page"""
     try:
-        sent_requests = JoinRequestService.get_user_join_requests(db, current_user.id)
+        sent_requests, next_sent_cursor = split_page(
+            JoinRequestService.get_user_join_requests(
+                db,
+                current_user.id,
+                cursor=sent_cursor,
+                limit=Pagination.PAGE_SIZE + 1,
+            ),
+            Pagination.PAGE_SIZE,
+        )
 
-        pending_requests = JoinRequestService.get_pending_requests_for_organizer(
-            db, current_user.id
+        pending_requests, next_pending_cursor = split_page(
+            JoinRequestService.get_pending_requests_for_organizer(
+                db,
+                current_user.id,
+                cursor=pending_cursor,
+                limit=Pagination.PAGE_SIZE + 1,
+            ),
+            Pagination.PAGE_SIZE,
         )
 
         return templates.TemplateResponse(
@@ -414,9 +477,11 @@ async def view_requests(
                 "request": request,
                 "current_user": current_user,
                 "sent_requests": sent_requests if sent_requests is not None else [],
-                "pending_requests": pending_requests
-                if pending_requests is not None
-                else [],
+                "pending_requests": (
+                    pending_requests if pending_requests is not None else []
+                ),
+                "next_sent_cursor": next_sent_cursor,
+                "next_pending_cursor": next_pending_cursor,
             },
         )
     except Exception as e:
@@ -493,20 +558,39 @@ async def start_draw(
 @router.get("/gifts", response_class=HTMLResponse)
 async def view_gifts(
     request: Request,
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_template_user),
     db: Session = Depends(get_db),
 ):
     """View gifts page"""
     try:
-        games_data = GiftService.get_user_gifts_overview(db, current_user.id)
-
-        return templates.TemplateResponse(
-            "gifts.html",
-            {
-                "request": request,
-                "current_user": current_user,
-                "games_data": games_data,
-            },
+        validators = Validators.for_user(
+            current_user,
+            GameService.get_games_version(db, current_user.id, role="participant"),
+            "gifts",
+            cursor,
+        )
+        if validators.matches(request):
+            return validators.not_modified()
+
+        games_data, next_cursor = split_page(
+            GiftService.get_user_gifts_overview(
+                db, current_user.id, cursor=cursor, limit=Pagination.PAGE_SIZE + 1
+            ),
+            Pagination.PAGE_SIZE,
+            key=lambda view: view.game,
+        )
+
+        return validators.apply(
+            stream_template(
+                "gifts.html",
+                {
+                    "request": request,
+                    "current_user": current_user,
+                    "games_data": games_data,
+                    "next_cursor": next_cursor,
+                },
+            )
         )
 
     except Exception as e:
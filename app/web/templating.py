@@ -0,0 +1,81 @@
+from typing import Iterator, Optional
+
+from jinja2 import Template, nodes
+from jinja2.ext import Extension
+from starlette.responses import StreamingResponse
+from starlette.templating import Jinja2Templates
+
+from app.constants import Streaming
+from app.core.fragments import fragment_cache
+from app.web.assets import static_url
+
+
+class FragmentCacheExtension(Extension):
+    """
+    ``{% cache "name", game.id, stamp, ... %}...{% endcache %}`` renders the
+    body once and serves it from the fragment cache while the game id and
+    version stamps stay the same
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method("_render", [nodes.List(args)]), [], [], body
+        ).set_lineno(lineno)
+
+    @staticmethod
+    def _render(key_parts, caller):
+        key = fragment_cache.key(*key_parts)
+        html = fragment_cache.get(key)
+        if html is None:
+            html = caller()
+            fragment_cache.set(key, html)
+        return html
+
+
+templates = Jinja2Templates(directory="templates")
+templates.env.add_extension(FragmentCacheExtension)
+templates.env.globals["static_url"] = static_url
+
+
+def _render_chunks(template: Template, context: dict) -> Iterator[str]:
+    """Renders the template with Jinja's generate() joined into bigger chunks"""
+    buffer, size = [], 0
+    for piece in template.generate(context):
+        buffer.append(piece)
+        size += len(piece)
+        if size >= Streaming.CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def stream_template(
+    name: str,
+    context: dict,
+    status_code: int = 200,
+    headers: Optional[dict] = None,
+) -> StreamingResponse:
+    """
+    Streaming counterpart of templates.TemplateResponse for big pages: the
+    first chunk is sent as soon as it is rendered and the whole page is never
+    held in memory. Errors raised mid-render can only abort the response, so
+    everything the page needs should be loaded before calling it
+    """
+    request = context["request"]
+    for processor in templates.context_processors:
+        context.update(processor(request))
+    template = templates.get_template(name)
+    return StreamingResponse(
+        _render_chunks(template, context),
+        status_code=status_code,
+        headers=headers,
+        media_type="text/html",
+    )
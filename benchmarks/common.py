@@ -0,0 +1,54 @@
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Optional
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.db.database import Base, RoutingSession, SoftDeleteQuery  # noqa: E402
+
+
+def make_engine(url: Optional[str] = None, **kwargs):
+    """Engine for a benchmark database - a fresh SQLite file by default"""
+    if url is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="santa-bench-"), "bench.db")
+        url = f"sqlite:///{path}"
+    engine = create_engine(url, **kwargs)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def make_session_factory(engine):
+    return sessionmaker(
+        bind=engine,
+        class_=RoutingSession,
+        query_cls=SoftDeleteQuery,
+        expire_on_commit=False,
+    )
+
+
+def measure(func: Callable[[], object], repeat: int = 20) -> dict:
+    """Runs the function `repeat` times and returns timings in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+    }
+
+
+def print_result(name: str, result: dict) -> None:
+    print(
+        f"{name:<40} min {result['min']:8.2f} ms   "
+        f"median {result['median']:8.2f} ms   max {result['max']:8.2f} ms"
+    )
@@ -0,0 +1,93 @@
+"""
+Game creation throughput on a database that already has millions of games.
+
+    python -m benchmarks.game_creation --games 2000000 --creates 500
+
+Compares the old key generation that probed `games` for every candidate
+with inserting a random key and retrying on a unique constraint violation.
+Pass --url to run against PostgreSQL instead of a temporary SQLite file.
+"""
+
+import argparse
+import secrets
+import time
+
+from benchmarks.common import make_engine, make_session_factory
+from sqlalchemy import insert
+
+from app.core.security import SECRET_KEY_ALPHABET, SECRET_KEY_LENGTH
+from app.db.models import Game, User
+from app.schemas.games import GameCreateData
+from app.service.game_service import GameService
+
+
+def seed(engine, games: int, batch: int = 50000) -> None:
+    """Creates the organizer with id 1 and `games` of their games"""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User), [{"id": 1, "email": "o@mail.com", "password_hash": "-"}]
+        )
+        for start in range(0, games, batch):
+            conn.execute(
+                insert(Game),
+                [
+                    {
+                        "title": f"Game {i}",
+                        "secret_key": f"{i:010d}",
+                        "organizer_id": 1,
+                        "is_deleted": False,
+                    }
+                    for i in range(start, min(start + batch, games))
+                ],
+            )
+
+
+def legacy_secret_key(db) -> str:
+    """Key generation used before: a SELECT for every candidate key"""
+    while True:
+        key = "".join(
+            secrets.choice(SECRET_KEY_ALPHABET) for _ in range(SECRET_KEY_LENGTH)
+        )
+        existing_key = (
+            db.query(Game).filter_by(secret_key=key, is_deleted=False).first()
+        )
+        if not existing_key:
+            return key
+
+
+def create_games(session_factory, creates: int, make_key) -> float:
+    """Creates games one per transaction and returns games per second"""
+    started_at = time.perf_counter()
+    for _ in range(creates):
+        with session_factory() as db:
+            GameService.create_game(
+                db,
+                GameCreateData(
+                    title="Benchmark", organizer_id=1, secret_key=make_key(db)
+                ),
+            )
+    return creates / (time.perf_counter() - started_at)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--games", type=int, default=1000000)
+    parser.add_argument("--creates", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = make_engine(args.url)
+    seed(engine, args.games)
+    session_factory = make_session_factory(engine)
+    print(f"{args.games} existing games ({engine.dialect.name})")
+
+    for name, make_key in (
+        ("probe every candidate key", legacy_secret_key),
+        ("insert and retry on conflict", lambda db: None),
+    ):
+        rate = create_games(session_factory, args.creates, make_key)
+        print(f"{name:<30} {rate:8.1f} games/sec")
+
+
+if __name__ == "__main__":
+    main()
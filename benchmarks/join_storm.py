@@ -0,0 +1,160 @@
+"""
+Join storm: many users join one game at the same time and every user
+submits the join form twice.
+
+    python -m benchmarks.join_storm --users 300 --workers 16
+
+Compares the old check-then-insert join with GameService.join_the_game and
+checks that each user ends up with exactly one request (or participation).
+Pass --public to join a public game and --url to run against PostgreSQL
+instead of a temporary SQLite file.
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import make_engine, make_session_factory
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import DBAPIError
+
+from app.constants import JoinRequestStatus, NotificationsData
+from app.db.models import (
+    Game,
+    JoinRequest,
+    Notification,
+    NotificationReceiver,
+    Participant,
+    User,
+)
+from app.service.game_service import GameService
+
+SECRET_KEY = "STORM00001"
+
+
+def seed(engine, users: int, is_private: bool) -> None:
+    """Creates the organizer with id 1, the game and the joining users"""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {"id": i, "email": f"user{i}@mail.com", "password_hash": "-"}
+                for i in range(1, users + 2)
+            ],
+        )
+        conn.execute(
+            insert(Game),
+            [
+                {
+                    "id": 1,
+                    "title": "Storm",
+                    "secret_key": SECRET_KEY,
+                    "organizer_id": 1,
+                    "is_private": is_private,
+                }
+            ],
+        )
+
+
+def legacy_join_the_game(db, user_id: int, secret_key: str) -> None:
+    """Join path used before the single-query check and ON CONFLICT inserts"""
+    game = db.query(Game).filter(Game.secret_key == secret_key).first_not_deleted()
+    if not game:
+        raise ValueError("Игра по такому секретному ключу не найдена")
+    if db.query(Participant).filter_by(user_id=user_id, game_id=game.id).first():
+        raise ValueError("Вы уже участвуете в этой игре")
+    if (
+        db.query(JoinRequest)
+        .filter_by(user_id=user_id, game_id=game.id, status=JoinRequestStatus.PENDING)
+        .first()
+    ):
+        raise ValueError("Вы уже подали заявку на вступление в эту игру")
+
+    if game.is_private:
+        db.get(User, user_id)
+        db.get(Game, game.id)
+        db.add(
+            JoinRequest(
+                user_id=user_id, game_id=game.id, organizer_id=game.organizer_id
+            )
+        )
+        text = NotificationsData.NEW_JOIN_REQUEST
+    else:
+        db.add(Participant(user_id=user_id, game_id=game.id))
+        text = NotificationsData.NEW_PARTICIPANT_IN_GAME
+    db.commit()
+
+    notification = Notification(game_id=game.id, text=text)
+    db.add(notification)
+    db.commit()
+    db.refresh(notification)
+
+    db.add(NotificationReceiver(notification_id=notification.id, user_id=1))
+    db.commit()
+
+
+def storm(session_factory, join, users: int, workers: int) -> dict:
+    """Every user joins twice from concurrent workers"""
+    outcome = {"joined": 0, "rejected": 0, "errors": 0}
+
+    def attempt(user_id: int) -> str:
+        with session_factory() as db:
+            try:
+                join(db, user_id, SECRET_KEY)
+                return "joined"
+            except ValueError:
+                return "rejected"
+            except DBAPIError:
+                db.rollback()
+                return "errors"
+
+    user_ids = [user_id for user_id in range(2, users + 2) for _ in range(2)]
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(attempt, user_ids):
+            outcome[result] += 1
+    outcome["seconds"] = time.perf_counter() - started_at
+    return outcome
+
+
+def count_duplicates(engine, is_private: bool) -> int:
+    """Number of users with more than one request/participation"""
+    model = JoinRequest if is_private else Participant
+    per_user = (
+        select(model.user_id)
+        .group_by(model.user_id)
+        .having(func.count(model.id) > 1)
+        .subquery()
+    )
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(per_user)).scalar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--users", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--public", action="store_true")
+    args = parser.parse_args()
+    is_private = not args.public
+
+    for name, join in (
+        ("check-then-insert", legacy_join_the_game),
+        ("single check + ON CONFLICT", GameService.join_the_game),
+    ):
+        kwargs = {"connect_args": {"timeout": 30}} if args.url is None else {}
+        engine = make_engine(args.url, pool_size=args.workers, **kwargs)
+        seed(engine, args.users, is_private)
+        outcome = storm(make_session_factory(engine), join, args.users, args.workers)
+        print(
+            f"{name:<28} {outcome['joined'] / outcome['seconds']:8.1f} joins/sec   "
+            f"joined {outcome['joined']}   rejected {outcome['rejected']}   "
+            f"errors {outcome['errors']}   "
+            f"duplicates {count_duplicates(engine, is_private)}"
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark of GameService.get_filtered_user_games on a user who takes part
+in hundreds of games that have thousands of participants each.
+
+    python -m benchmarks.user_games --games 300 --participants 2000
+
+Pass --url to run against PostgreSQL instead of a temporary SQLite file.
+"""
+
+import argparse
+import random
+
+from benchmarks.common import make_engine, make_session_factory, measure, print_result
+from sqlalchemy import insert, or_
+
+from app.db.models import Game, Participant, User
+from app.service.game_service import GameService
+
+
+def seed(engine, games: int, participants: int, users: int) -> int:
+    """Creates the dataset and returns id of the user in all games"""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {"id": i, "email": f"user{i}@mail.com", "password_hash": "-"}
+                for i in range(1, users + 1)
+            ],
+        )
+        conn.execute(
+            insert(Game),
+            [
+                {
+                    "id": i,
+                    "title": f"Game {i}",
+                    "secret_key": f"k{i:09d}",
+                    "organizer_id": 1 if i % 10 == 0 else random.randint(2, users),
+                    "is_deleted": False,
+                }
+                for i in range(1, games + 1)
+            ],
+        )
+        for game_id in range(1, games + 1):
+            members = random.sample(range(2, users + 1), participants - 1)
+            if game_id % 10:
+                members.append(1)
+            conn.execute(
+                insert(Participant),
+                [
+                    {"user_id": user_id, "game_id": game_id, "is_deleted": False}
+                    for user_id in members
+                ],
+            )
+    return 1
+
+
+def legacy_filtered_user_games(db, user_id: int):
+    """Query used before the UNION ALL rewrite"""
+    return (
+        db.query(Game)
+        .not_deleted()
+        .outerjoin(Participant)
+        .filter(or_(Game.organizer_id == user_id, Participant.user_id == user_id))
+        .distinct()
+        .order_by(Game.created_at.desc())
+        .all()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--games", type=int, default=300)
+    parser.add_argument("--participants", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = make_engine(args.url)
+    user_id = seed(engine, args.games, args.participants, args.users)
+    session_factory = make_session_factory(engine)
+    print(
+        f"{args.games} games x {args.participants} participants, "
+        f"{args.users} users ({engine.dialect.name})"
+    )
+
+    with session_factory() as db:
+        legacy = legacy_filtered_user_games(db, user_id)
+        current = GameService.get_filtered_user_games(db, user_id)
+        assert {g.id for g in legacy} == {g.id for g in current}
+        print(f"user is in {len(current)} games")
+
+        print_result(
+            "OR + outer join + DISTINCT",
+            measure(lambda: legacy_filtered_user_games(db, user_id), args.repeat),
+        )
+        print_result(
+            "UNION ALL membership lookup",
+            measure(
+                lambda: GameService.get_filtered_user_games(db, user_id), args.repeat
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+from app.web.assets import ENCODINGS, build_assets
+
+if __name__ == "__main__":
+    manifest = build_assets()
+    encodings = ", ".join(encoding for encoding, _ in ENCODINGS)
+    for source, built in manifest.items():
+        print(f"{source} -> {built} ({encodings})")
@@ -0,0 +1,11 @@
+from app.db.database import SessionLocal
+from app.service.game_stats_service import GameStatsService
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        updated = GameStatsService.reconcile(db)
+        db.commit()
+        print(f"Счетчики пересчитаны для игр: {updated}")
+    finally:
+        db.close()
@@ -1,5 +1,7 @@
 import pytest
 
+from app.core.cache import get_caches
+from app.db.query_stats import assert_max_queries, install_query_stats
 from app.schemas.games import GameCreateData
 from app.schemas.users import UserCreateData
 from app.service.draw_service import DrawService
@@ -12,7 +14,22 @@ from tests.constants.data import (
     TestUser2,
     TestUser3,
 )
-from tests.constants.db import SessionLocal, drop_test_db, init_test_db
+from tests.constants.db import (
+    ReplicatedSessionLocal,
+    SessionLocal,
+    engine,
+    drop_test_db,
+    drop_test_replica_db,
+    init_test_db,
+    init_test_replica_db,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Test databases reuse ids, so cached entries must not leak between tests"""
+    for cache in get_caches():
+        cache.clear()
 
 
 @pytest.fixture()
@@ -26,6 +43,26 @@ def init_db():
     drop_test_db()
 
 
+@pytest.fixture()
+def init_replicated_db():
+    init_test_db()
+    init_test_replica_db()
+    db = ReplicatedSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+    drop_test_replica_db()
+    drop_test_db()
+
+
+@pytest.fixture
+def query_budget():
+    """Context manager that fails the test when a block exceeds its query budget"""
+    install_query_stats(engine)
+    return assert_max_queries
+
+
 @pytest.fixture
 def first_user_data():
     return UserCreateData(
@@ -0,0 +1,36 @@
+import asyncio
+
+
+def get(app, path: str, **headers) -> dict:
+    """Performs GET request to the ASGI app and collects the response"""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [
+            (name.replace("_", "-").encode(), value.encode())
+            for name, value in headers.items()
+        ],
+    }
+    response = {"body": b"", "chunks": []}
+
+    requested = asyncio.Event()
+
+    async def receive():
+        if requested.is_set():
+            await asyncio.Event().wait()
+        requested.set()
+        return {"type": "http.request"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {
+                name.decode(): value.decode() for name, value in message["headers"]
+            }
+        else:
+            response["chunks"].append(message.get("body", b""))
+            response["body"] += message.get("body", b"")
+
+    asyncio.run(app(scope, receive, send))
+    return response
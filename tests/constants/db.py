@@ -1,11 +1,24 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.db.database import Base, SoftDeleteQuery
+from app.db.database import Base, RoutingSession, SoftDeleteQuery
 
 engine = create_engine("sqlite:///./test.db")
+replica_engine = create_engine("sqlite:///./test_replica.db")
 
-SessionLocal = sessionmaker(bind=engine, query_cls=SoftDeleteQuery)
+SessionLocal = sessionmaker(
+    bind=engine,
+    class_=RoutingSession,
+    query_cls=SoftDeleteQuery,
+    expire_on_commit=False,
+)
+ReplicatedSessionLocal = sessionmaker(
+    bind=engine,
+    class_=RoutingSession,
+    query_cls=SoftDeleteQuery,
+    expire_on_commit=False,
+    info={"replicas": [replica_engine]},
+)
 
 
 def init_test_db():
@@ -14,3 +27,11 @@ def init_test_db():
 
 def drop_test_db():
     Base.metadata.drop_all(bind=engine)
+
+
+def init_test_replica_db():
+    Base.metadata.create_all(bind=replica_engine)
+
+
+def drop_test_replica_db():
+    Base.metadata.drop_all(bind=replica_engine)
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.web import api
+
+
+def test_api_games_fields_and_pagination(create_game_with_participants_for_draw):
+    """
+    Scenario
+
+    1. Create default test game with three participants
+    2. Request games of a participant with one item per page and two fields
+    3. Check only the selected fields are returned and there is no next page
+    4. Check unknown fields are rejected
+    """
+    db, game, first_user, _, _, _ = create_game_with_participants_for_draw
+
+    response = api.games(
+        role="all",
+        status="all",
+        cursor=None,
+        limit=1,
+        fields="id,participants_count",
+        current_user=first_user,
+        db=db,
+    )
+    body = json.loads(response.body)
+
+    assert body == {
+        "items": [{"id": game.id, "participants_count": 3}],
+        "next_cursor": None,
+    }, f"{body} is not the expected page"
+
+    with pytest.raises(HTTPException) as error:
+        api.games(fields="id,secret_key", current_user=first_user, db=db)
+    assert error.value.status_code == 400, f"{error.value.status_code} not equal to 400"
@@ -0,0 +1,40 @@
+import gzip
+
+from app.web.assets import PrecompressedStaticFiles, build_assets
+from tests.constants.asgi import get
+
+
+def test_build_and_serve_assets(tmp_path):
+    """
+    Scenario
+
+    1. Create stylesheet importing another one
+    2. Build assets and check bundle is minified and fingerprinted
+    3. Check gzip-accepting client gets precompressed immutable bundle
+    4. Check other clients get plain bundle and sources are revalidated
+    """
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "home.css").write_text(
+        "/* home */\n.home  >  a {\n    content: 'a  b';\n    color: red;\n}\n"
+    )
+    (tmp_path / "style.css").write_text("@import url('pages/home.css');\n")
+
+    manifest = build_assets(str(tmp_path), ["style.css"])
+    bundle = (tmp_path / manifest["style.css"]).read_bytes()
+
+    assert bundle == b".home>a{content:'a  b';color:red}", f"{bundle} is not minified"
+    assert manifest["style.css"].startswith(
+        "dist/style."
+    ), f"{manifest} not fingerprinted"
+
+    app = PrecompressedStaticFiles(directory=str(tmp_path))
+    compressed = get(app, f"/{manifest['style.css']}", accept_encoding="gzip, br;q=0")
+    plain = get(app, f"/{manifest['style.css']}")
+    source = get(app, "/style.css", accept_encoding="gzip")
+
+    assert compressed["headers"]["content-encoding"] == "gzip", "gzip copy not served"
+    assert gzip.decompress(compressed["body"]) == bundle, "gzip copy differs"
+    assert "immutable" in compressed["headers"]["cache-control"], "bundle not immutable"
+    assert plain["body"] == bundle, "plain bundle not served"
+    assert "content-encoding" not in plain["headers"], "unrequested encoding used"
+    assert source["headers"]["cache-control"] == "no-cache", "source cached forever"
@@ -0,0 +1,77 @@
+from starlette.requests import Request
+
+from app.db.models import Participant
+from app.schemas.gifts import GiftCreateData
+from app.service.draw_service import DrawService
+from app.service.game_service import GameService
+from app.service.gift_service import GiftService
+from app.service.user_service import UserService
+from app.web.conditional import Validators
+
+
+def conditional_request(**headers) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_game_page_validators(create_game_with_participants_for_draw):
+    """
+    Scenario
+
+    1. Create default test game with three participants
+    2. Build game page validators for the organizer
+    3. Check unchanged game matches both ETag and Last-Modified
+    4. Check draw, gift creation and a participant's wishlist change the ETag
+    5. Check another user never matches the organizer's ETag
+    """
+    db, game, first_user, second_user, _, organizer = (
+        create_game_with_participants_for_draw
+    )
+
+    def validators(user=organizer):
+        version = GameService.get_game_version(db, game.id)
+        return Validators.for_user(user, version, "game", game.id)
+
+    current = validators()
+    last_modified = current.headers()["Last-Modified"]
+    assert current.matches(
+        conditional_request(if_none_match=current.etag)
+    ), "unchanged game does not match its ETag"
+    assert current.matches(
+        conditional_request(if_modified_since=last_modified)
+    ), "unchanged game does not match its Last-Modified"
+    assert not validators(second_user).matches(
+        conditional_request(if_none_match=current.etag)
+    ), "ETag of another user matches"
+
+    etags = {current.etag}
+    DrawService.start_draw(db, organizer.id, game.id)
+    etags.add(validators().etag)
+
+    participant = (
+        db.query(Participant).filter_by(game_id=game.id, user_id=first_user.id).first()
+    )
+    GiftService.create_gift(
+        db,
+        GiftCreateData(
+            participant_id=participant.id,
+            receiver_participant_id=participant.assigned_to_id,
+            game_id=game.id,
+            title="Gift",
+            description="",
+            price=100.0,
+        ),
+    )
+    etags.add(validators().etag)
+
+    UserService.update_wishlist(db, first_user.id, "Socks")
+    etags.add(validators().etag)
+
+    assert len(etags) == 4, f"{len(etags)} not equal to 4"
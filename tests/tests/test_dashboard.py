@@ -0,0 +1,59 @@
+from app.constants import GiftStatus
+from app.db.models import Participant
+from app.schemas.gifts import GiftCreateData
+from app.service.dashboard_service import DashboardService
+from app.service.draw_service import DrawService
+from app.service.gift_service import GiftService
+
+
+def test_organizer_dashboard(create_game_with_participants_for_draw, query_budget):
+    """
+    Scenario
+
+    1. Create default test game with three participants
+    2. Check dashboard before the draw
+    3. Start draw, two participants create gifts and one of them is sent
+    4. Check dashboard reflects the changes despite the cache
+    5. Check repeated dashboard request is served from the cache
+    """
+    db, game, first_user, _, _, organizer = create_game_with_participants_for_draw
+
+    (progress,) = DashboardService.get_organizer_dashboard(db, organizer.id)
+    assert progress.givers == 0, f"{progress.givers} not equal to 0"
+    assert progress.average_price is None, f"{progress.average_price} is not None"
+
+    DrawService.start_draw(db, organizer.id, game.id)
+    participants = db.query(Participant).filter_by(game_id=game.id).all()
+    gifts = [
+        GiftService.create_gift(
+            db,
+            GiftCreateData(
+                participant_id=participant.id,
+                receiver_participant_id=participant.assigned_to_id,
+                game_id=game.id,
+                title="Gift",
+                description="",
+                price=price,
+            ),
+        )
+        for participant, price in zip(participants, [100.0, 300.0])
+    ]
+    GiftService.update_gift_status(
+        db, gifts[0].id, gifts[0].participant_id, GiftStatus.SENT
+    )
+
+    (progress,) = DashboardService.get_organizer_dashboard(db, organizer.id)
+    assert progress.participants == 3, f"{progress.participants} not equal to 3"
+    assert progress.givers == 3, f"{progress.givers} not equal to 3"
+    assert progress.givers_with_gift == 2, f"{progress.givers_with_gift} not equal to 2"
+    assert progress.gifts_sent == 1, f"{progress.gifts_sent} not equal to 1"
+    assert progress.gifts_received == 0, f"{progress.gifts_received} not equal to 0"
+    assert progress.average_price == 200.0, f"{progress.average_price} not equal to 200"
+
+    with query_budget(1):
+        (cached,) = DashboardService.get_organizer_dashboard(db, organizer.id)
+
+    assert cached == progress, f"{cached} not equal to {progress}"
+    assert (
+        DashboardService.get_organizer_dashboard(db, first_user.id) == []
+    ), "participant must not see games of other organizers"
@@ -0,0 +1,39 @@
+from app.core.fragments import fragment_cache
+from app.schemas.users import UserUpdateData
+from app.service.game_service import GameService
+from app.service.user_service import UserService
+from app.web.templating import templates
+
+
+def test_game_view_fragments(create_game_with_participants_for_draw):
+    """
+    Scenario
+
+    1. Create default test game with three participants
+    2. Render game page for the organizer twice
+    3. Check the second render is served from the fragment cache
+    4. Rename a participant and check the page shows the new name
+    """
+    db, game, first_user, _, _, organizer = create_game_with_participants_for_draw
+
+    def render() -> str:
+        game_view = GameService.get_game_view(db, game.id, organizer.id)
+        return templates.get_template("game-view.html").render(
+            request=None, current_user=organizer, game=game_view
+        )
+
+    first = render()
+    hits = fragment_cache.stats()["hits"]
+    second = render()
+
+    assert first == second, "cached page differs from rendered one"
+    assert fragment_cache.stats()["hits"] == hits + 1, "participants list not cached"
+    assert fragment_cache.stats()["bytes"] > 0, "cache holds no bytes"
+
+    UserService.update_user_data(
+        db,
+        first_user.id,
+        UserUpdateData(username="Renamed Santa", email=first_user.email),
+    )
+
+    assert "Renamed Santa" in render(), "stale participants list served"
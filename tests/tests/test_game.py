@@ -1,7 +1,11 @@
 from app.constants import JoinRequestStatus, NotificationsData
+from app.db.models import Game, Participant
+from app.db.pagination import split_page
 from app.schemas.games import GameCreateData
 from app.schemas.join_requests import NULL_DATA
-from app.service.game_service import GameService
+from app.service.draw_service import DrawService
+from app.service.game_service import GameService, secret_key_cache
+from app.service.game_stats_service import GameStatsService
 from tests.constants.data import TestGameData
 
 
@@ -101,3 +105,186 @@ def test_join_the_private_game(create_default_test_private_game):
     assert (
         join_result.join_request.status == JoinRequestStatus.PENDING
     ), f"{join_result.join_request.status} not equal to {JoinRequestStatus.PENDING}"
+
+
+def test_soft_deleted_rows_are_hidden(create_game_with_participants_for_draw):
+    """
+    Scenario
+
+    1. Create default test game with three participants
+    2. Soft delete one participant and then the game
+    3. Check deleted rows are hidden from queries and relationship loads
+    4. Check deleted rows are still reachable with explicit opt-out
+    """
+    db, game, first_user, _, _, organizer = create_game_with_participants_for_draw
+    participant = (
+        db.query(Participant).filter_by(user_id=first_user.id, game_id=game.id).first()
+    )
+    participant.is_deleted = True
+    db.commit()
+    db.expire(game)
+
+    assert len(game.participants) == 2, f"{len(game.participants)} not equal to 2"
+
+    GameService.delete_game(db, organizer.id, game.id)
+
+    assert db.query(Game).filter_by(id=game.id).first() is None, "Game is visible"
+    assert (
+        db.query(Game).filter_by(id=game.id).with_deleted().first() is not None
+    ), "Game is not reachable with with_deleted()"
+
+
+def test_filtered_user_games_query_budget(
+    create_game_with_participants_for_draw, query_budget
+):
+    """
+    Scenario
+
+    1. Create default test game with three participants
+    2. Get games of the organizer and of a participant
+    3. Check each listing runs a single query
+    """
+    db, game, first_user, _, _, organizer = create_game_with_participants_for_draw
+
+    for user_id in (organizer.id, first_user.id):
+        with query_budget(1):
+            games = GameService.get_filtered_user_games(db, user_id)
+
+        assert [g.id for g in games] == [game.id], f"{games} not equal to [{game}]"
+
+
+def test_game_view_query_budget(create_game_with_participants_for_draw, query_budget):
+    """
+    Scenario
+
+    1. Create default test game with three participants and start draw
+    2. Load the game view and touch everything the game page renders
+    3. Check the page data is loaded in a fixed number of queries
+    """
+    db, game, _, _, _, organizer = create_game_with_participants_for_draw
+    DrawService.start_draw(db, organizer.id, game.id)
+    game_id, organizer_id = game.id, organizer.id
+    db.expunge_all()
+
+    with query_budget(3):
+        game_view = GameService.get_game_view(db, game_id, organizer_id)
+        names = [game_view.organizer.username, len(game_view.draws)]
+        for participant in game_view.participants:
+            names.append(participant.user.username)
+            names.append(participant.assigned_to.user.username)
+
+    assert len(names) == 8, f"{len(names)} not equal to 8"
+
+
+def test_filtered_user_games_pagination(create_four_test_users):
+    """
+    Scenario
+
+    1. Create three games of one organizer
+    2. Get them by pages of two games
+    3. Check pages are ordered newest first and do not overlap
+    """
+    db, _, _, _, organizer = create_four_test_users
+    game_ids = [
+        GameService.create_game(
+            db,
+            GameCreateData.from_db(
+                db=db, title=TestGameData.title, organizer_id=organizer.id
+            ),
+        ).id
+        for _ in range(3)
+    ]
+
+    first_page, cursor = split_page(
+        GameService.get_filtered_user_games(db, organizer.id, limit=3), 2
+    )
+    second_page, last_cursor = split_page(
+        GameService.get_filtered_user_games(db, organizer.id, cursor=cursor, limit=3),
+        2,
+    )
+
+    assert [game.id for game in first_page + second_page] == game_ids[::-1], (
+        f"{[game.id for game in first_page + second_page]} not equal to "
+        f"{game_ids[::-1]}"
+    )
+    assert last_cursor is None, f"{last_cursor} is not None"
+
+
+def test_game_counters(create_game_with_participants_for_draw):
+    """
+    Scenario
+
+    1. Create default test game with three participants
+    2. Check participants counter was maintained by joins
+    3. Break the counter and reconcile it
+    4. Check the counter was recomputed
+    """
+    db, game, _, _, _, _ = create_game_with_participants_for_draw
+    db.refresh(game)
+
+    assert game.participants_count == 3, f"{game.participants_count} not equal to 3"
+
+    GameStatsService.adjust(db, game.id, participants_count=10)
+    GameStatsService.reconcile(db, [game.id])
+    db.commit()
+
+    assert game.participants_count == 3, f"{game.participants_count} not equal to 3"
+
+
+def test_secret_key_cache(create_default_test_game, query_budget):
+    """
+    Scenario
+
+    1. Create default test game, resolve its secret key and an unknown key
+    2. Check repeated lookups of both keys cost no queries
+    3. Delete the game and check its key no longer resolves
+    """
+    db, game, _, _, _, organizer = create_default_test_game
+    secret_key = game.secret_key
+
+    with query_budget(2):
+        game_key = GameService.lookup_secret_key(db, secret_key)
+        GameService.lookup_secret_key(db, "UNKNOWN")
+    hits = secret_key_cache.hits
+    with query_budget(0):
+        cached_key = GameService.lookup_secret_key(db, secret_key)
+        unknown_key = GameService.lookup_secret_key(db, "UNKNOWN")
+
+    assert game_key.id == game.id, f"{game_key.id} not equal to {game.id}"
+    assert cached_key == game_key, f"{cached_key} not equal to {game_key}"
+    assert unknown_key is None, f"{unknown_key} is not None"
+    assert secret_key_cache.hits - hits == 2, f"{secret_key_cache.stats()}"
+
+    GameService.delete_game(db, organizer.id, game.id)
+
+    assert (
+        GameService.lookup_secret_key(db, secret_key) is None
+    ), "deleted game is still resolved by its secret key"
+
+
+def test_secret_key_collision_is_retried(create_default_test_game, query_budget):
+    """
+    Scenario
+
+    1. Create default test game
+    2. Create another game whose generated key collides with the first one
+    3. Check the second game got a new unique key without probing queries
+    """
+    db, game, _, _, _, organizer = create_default_test_game
+
+    with query_budget(8) as stats:
+        second_game = GameService.create_game(
+            db,
+            GameCreateData(
+                title=TestGameData.title,
+                organizer_id=organizer.id,
+                secret_key=game.secret_key,
+            ),
+        )
+
+    probes = [s for s in stats.statements if s.startswith("SELECT games")]
+    assert probes == [], f"{probes} is not empty"
+    assert second_game.id is not None, "second game was not saved"
+    assert (
+        second_game.secret_key != game.secret_key
+    ), f"{second_game.secret_key} equal to {game.secret_key}"
@@ -0,0 +1,132 @@
+from app.constants import GiftStatus
+from app.db.models import Participant
+from app.schemas.gifts import GiftCreateData
+from app.service.draw_service import DrawService
+from app.service.gift_service import GiftService
+from app.service.participant_service import ParticipantService
+
+
+def test_user_gifts_overview(create_game_with_participants_for_draw, query_budget):
+    """
+    Scenario
+
+    1. Create default test game with three participants and start draw
+    2. Every participant creates a gift for their receiver
+    3. Get gifts overview of the first user
+    4. Check both gift directions and the receiver are loaded in two queries
+    """
+    db, game, first_user, _, _, organizer = create_game_with_participants_for_draw
+    DrawService.start_draw(db, organizer.id, game.id)
+    participants = db.query(Participant).filter_by(game_id=game.id).all()
+    for participant in participants:
+        GiftService.create_gift(
+            db,
+            GiftCreateData(
+                participant_id=participant.id,
+                receiver_participant_id=participant.assigned_to_id,
+                game_id=game.id,
+                title=f"Gift from {participant.id}",
+                description="",
+                price=100.0,
+            ),
+        )
+    first_user_id = first_user.id
+    db.expunge_all()
+
+    with query_budget(2):
+        overview = GiftService.get_user_gifts_overview(db, first_user_id)
+        view = overview[0]
+        receiver_email = view.receiver.email
+        participation = view.participation
+
+    assert len(overview) == 1, f"{len(overview)} not equal to 1"
+    assert (
+        view.my_gift.participant_id == participation.id
+    ), f"{view.my_gift.participant_id} not equal to {participation.id}"
+    assert (
+        view.gift_for_me.receiver_participant_id == participation.id
+    ), f"{view.gift_for_me.receiver_participant_id} not equal to {participation.id}"
+    assert (
+        view.receiver.id == participation.assigned_to.user_id
+    ), f"{receiver_email} is not the assigned receiver"
+
+
+def test_gift_status_counters(create_game_with_participants_for_draw):
+    """
+    Scenario
+
+    1. Create default test game with three participants and start draw
+    2. Create a gift, send it and then delete it
+    3. Check gift status counters of the game follow every step
+    """
+    db, game, first_user, _, _, organizer = create_game_with_participants_for_draw
+    DrawService.start_draw(db, organizer.id, game.id)
+    participant = (
+        db.query(Participant).filter_by(game_id=game.id, user_id=first_user.id).first()
+    )
+    gift = GiftService.create_gift(
+        db,
+        GiftCreateData(
+            participant_id=participant.id,
+            receiver_participant_id=participant.assigned_to_id,
+            game_id=game.id,
+            title="Gift",
+            description="",
+            price=100.0,
+        ),
+    )
+    db.refresh(game)
+
+    assert game.gifts_planned_count == 1, f"{game.gifts_planned_count} not equal to 1"
+
+    GiftService.update_gift_status(db, gift.id, participant.id, GiftStatus.SENT)
+    db.refresh(game)
+
+    assert game.gifts_planned_count == 0, f"{game.gifts_planned_count} not equal to 0"
+    assert game.gifts_sent_count == 1, f"{game.gifts_sent_count} not equal to 1"
+
+    GiftService.delete_gift(db, gift.id)
+    db.refresh(game)
+
+    assert game.gifts_sent_count == 0, f"{game.gifts_sent_count} not equal to 0"
+    assert not game.is_deleted, "Game was deleted together with the gift"
+
+
+def test_writes_skip_reload_after_commit(create_default_test_game, query_budget):
+    """
+    Scenario
+
+    1. Create default test game
+    2. Add a participant, create a gift for them and send it
+    3. Check every write costs only its own statements and reading the
+       written objects and game counters afterwards costs no queries
+    """
+    db, game, first_user, _, _, _ = create_default_test_game
+
+    with query_budget(3):
+        participant = ParticipantService.create_participant(db, first_user.id, game.id)
+        assert game.participants_count == 1, f"{game.participants_count} not equal to 1"
+
+    with query_budget(2):
+        gift = GiftService.create_gift(
+            db,
+            GiftCreateData(
+                participant_id=participant.id,
+                receiver_participant_id=participant.id,
+                game_id=game.id,
+                title="Gift",
+                description="",
+                price=100.0,
+            ),
+        )
+        assert gift.id is not None, "gift id was not assigned"
+        assert (
+            game.gifts_planned_count == 1
+        ), f"{game.gifts_planned_count} not equal to 1"
+
+    with query_budget(3):
+        gift = GiftService.update_gift_status(
+            db, gift.id, participant.id, GiftStatus.SENT
+        )
+        assert gift.sent_at is not None, "sent_at was not set"
+        assert game.gifts_sent_count == 1, f"{game.gifts_sent_count} not equal to 1"
@@ -0,0 +1,107 @@
+import pytest
+from sqlalchemy import event
+
+from app.constants import JoinRequestStatus
+from app.db.models import PENDING_REQUEST, JoinRequest
+from app.db.upsert import insert_or_ignore
+from app.service.game_service import GameService
+from app.service.join_requset_service import JoinRequestService
+from app.service.participant_service import ParticipantService
+
+
+def test_requests_page_query_budget(create_default_test_private_game, query_budget):
+    """
+    Scenario
+
+    1. Create private test game and send join requests from three users
+    2. Get pending requests of the organizer and sent requests of a user
+    3. Check everything the requests page renders is loaded in one query each
+    """
+    db, game, first_user, second_user, third_user, organizer = (
+        create_default_test_private_game
+    )
+    for user in (first_user, second_user, third_user):
+        GameService.join_the_game(db, user.id, game.secret_key)
+    organizer_id, first_user_id = organizer.id, first_user.id
+    db.expunge_all()
+
+    with query_budget(1):
+        pending_requests = JoinRequestService.get_pending_requests_for_organizer(
+            db, organizer_id
+        )
+        pending_users = [(r.user.email, r.game.title) for r in pending_requests]
+
+    with query_budget(1):
+        sent_requests = JoinRequestService.get_user_join_requests(db, first_user_id)
+        sent_games = [(r.game.title, r.game.organizer.email) for r in sent_requests]
+
+    assert len(pending_users) == 3, f"{len(pending_users)} not equal to 3"
+    assert len(sent_games) == 1, f"{len(sent_games)} not equal to 1"
+
+
+def test_join_and_approve_commit_once(create_default_test_private_game):
+    """
+    Scenario
+
+    1. Create private test game, the first user sends a join request
+    2. The user becomes a participant by other means, so approving must fail
+    3. Check the failed approval left no partial state behind
+    4. Check joining the game is committed exactly once
+    """
+    db, game, first_user, second_user, _, organizer = create_default_test_private_game
+    commits = []
+    event.listen(db, "after_commit", lambda session: commits.append(session))
+
+    GameService.join_the_game(db, first_user.id, game.secret_key)
+    assert len(commits) == 1, f"{len(commits)} not equal to 1"
+
+    join_request = db.query(JoinRequest).filter_by(user_id=first_user.id).first()
+    ParticipantService.create_participant(db, first_user.id, game.id)
+    with pytest.raises(ValueError):
+        JoinRequestService.approve_join_request(db, join_request.id, organizer.id)
+    db.refresh(game)
+
+    assert (
+        join_request.status == JoinRequestStatus.PENDING
+    ), f"{join_request.status} not equal to {JoinRequestStatus.PENDING}"
+    assert (
+        game.requests_approved_count == 0
+    ), f"{game.requests_approved_count} not equal to 0"
+    assert game.participants_count == 1, f"{game.participants_count} not equal to 1"
+
+
+def test_duplicate_joins_are_rejected(create_default_test_private_game, query_budget):
+    """
+    Scenario
+
+    1. Create private test game, with its secret key already resolved
+       the first user joins it in five statements
+    2. Check joining again is rejected
+    3. Check a concurrent duplicate insert is ignored by the unique index
+    4. Check there is exactly one pending request and the counter agrees
+    """
+    db, game, first_user, _, _, organizer = create_default_test_private_game
+    user_id, game_id, organizer_id = first_user.id, game.id, organizer.id
+
+    GameService.lookup_secret_key(db, game.secret_key)
+    with query_budget(5):
+        GameService.join_the_game(db, user_id, game.secret_key)
+
+    with pytest.raises(ValueError):
+        GameService.join_the_game(db, user_id, game.secret_key)
+
+    duplicate = insert_or_ignore(
+        db,
+        JoinRequest,
+        {"user_id": user_id, "game_id": game_id, "organizer_id": organizer_id},
+        index_elements=["user_id", "game_id"],
+        index_where=PENDING_REQUEST,
+    )
+    db.commit()
+    requests = db.query(JoinRequest).filter_by(user_id=user_id, game_id=game_id).all()
+
+    assert duplicate is None, f"{duplicate} is not None"
+    assert len(requests) == 1, f"{len(requests)} not equal to 1"
+    assert (
+        game.requests_pending_count == 1
+    ), f"{game.requests_pending_count} not equal to 1"
@@ -0,0 +1,43 @@
+from app.db.database import read_only
+from app.db.models import User
+from app.service.user_service import UserService
+
+
+@read_only
+def find_user_by_email(db, email):
+    return db.query(User).filter(User.email == email).first()
+
+
+def test_read_only_queries_go_to_replica(init_replicated_db, first_user_data):
+    """
+    Scenario
+
+    1. Create user on the primary database
+    2. Read it back in a read-only method from a new session
+    3. Check the read was served by the empty replica
+    """
+    db = init_replicated_db
+    UserService.create_user(db, first_user_data)
+    db.close()
+
+    user = find_user_by_email(db, first_user_data.email)
+
+    assert user is None, f"{user} was read from the primary"
+
+
+def test_client_reads_own_writes(init_replicated_db, first_user_data):
+    """
+    Scenario
+
+    1. Create user on the primary database on behalf of a client
+    2. Read it back in a read-only method for the same client
+    3. Check the read was served by the primary
+    """
+    db = init_replicated_db
+    db.info["sticky_key"] = "test-client"
+    UserService.create_user(db, first_user_data)
+    db.close()
+
+    user = find_user_by_email(db, first_user_data.email)
+
+    assert user is not None, "Recent write was not read from the primary"
@@ -0,0 +1,48 @@
+from app.db.slow_queries import SlowQueryLog, normalize_statement
+from app.service.game_service import GameService
+from tests.constants.db import engine
+
+
+def test_slow_queries_are_aggregated_with_plan(create_default_test_game):
+    """
+    Scenario
+
+    1. Record every statement as slow
+    2. Run the same service query twice
+    3. Check both runs are aggregated under one fingerprint
+    4. Check the call site and the SQLite query plan were captured
+    """
+    db, _, _, _, _, organizer = create_default_test_game
+    organizer_id = organizer.id
+    slow_query_log = SlowQueryLog(threshold_ms=0)
+    slow_query_log.install(engine)
+    try:
+        GameService.get_filtered_user_games(db, organizer_id)
+        GameService.get_filtered_user_games(db, organizer_id)
+        slow_query_log.wait_for_plans()
+    finally:
+        slow_query_log.uninstall(engine)
+
+    entry = slow_query_log.entries()[0]
+
+    assert entry["count"] == 2, f"{entry['count']} not equal to 2"
+    assert (
+        "app.service.game_service.GameService.get_filtered_user_games"
+        in entry["call_sites"]
+    ), f"{entry['call_sites']} has no service call site"
+    assert entry["plan"] and "games" in entry["plan"], f"{entry['plan']} has no plan"
+
+
+def test_normalize_statement():
+    """
+    Scenario
+
+    1. Normalize statements that differ only in literals and IN list size
+    2. Check they are equal after normalization
+    """
+    first = normalize_statement("SELECT * FROM games WHERE id IN (?, ?) AND x = 'a'")
+    second = normalize_statement(
+        "SELECT *  FROM games\nWHERE id IN (?, ?, ?) AND x = 5"
+    )
+
+    assert first == second, f"{first} not equal to {second}"
@@ -0,0 +1,62 @@
+import zlib
+
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, StreamingResponse
+
+from app.service.game_service import GameService
+from app.web.middleware import CompressionMiddleware
+from app.web.templating import stream_template, templates
+from tests.constants.asgi import get
+
+
+def test_streamed_game_page(create_game_with_participants_for_draw):
+    """
+    Scenario
+
+    1. Create default test game with three participants
+    2. Stream game page for the organizer
+    3. Check streamed page equals the page rendered at once
+    """
+    db, game, _, _, _, organizer = create_game_with_participants_for_draw
+    context = {
+        "request": Request({"type": "http"}),
+        "current_user": organizer,
+        "game": GameService.get_game_view(db, game.id, organizer.id),
+    }
+
+    rendered = templates.get_template("game-view.html").render(context)
+    streamed = get(stream_template("game-view.html", dict(context)), "/")
+
+    assert streamed["body"].decode() == rendered, "streamed page differs"
+
+
+def test_compression_middleware():
+    """
+    Scenario
+
+    1. Wrap streaming and small responses into compression middleware
+    2. Check every streamed chunk is flushed compressed right away
+    3. Check small responses and clients without gzip are not compressed
+    """
+    chunks = [b"a" * 2000, b"b" * 2000]
+
+    def streaming_app():
+        return CompressionMiddleware(
+            StreamingResponse(iter(chunks)), minimum_size=500, level=6
+        )
+
+    compressed = get(streaming_app(), "/", accept_encoding="gzip, deflate")
+    identity = get(streaming_app(), "/")
+    small = get(
+        CompressionMiddleware(PlainTextResponse("ok"), minimum_size=500),
+        "/",
+        accept_encoding="gzip",
+    )
+
+    assert compressed["headers"]["content-encoding"] == "gzip", "not compressed"
+    assert all(compressed["chunks"][:2]), "streamed chunk was not flushed"
+    assert zlib.decompress(compressed["body"], 16 + zlib.MAX_WBITS) == b"".join(
+        chunks
+    ), "compressed body differs"
+    assert "content-encoding" not in identity["headers"], "compressed without gzip"
+    assert "content-encoding" not in small["headers"], "small response compressed"